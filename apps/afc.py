@@ -5,9 +5,12 @@ from threading import Thread
 import pygame
 
 from score_render import ASSETS_DIR
-from score_render.elements import TextBox, AnimationPNG  # Assuming the class is saved in `textbox.py`
+from score_render.elements import TextBox, TextLayoutCache, AnimationPNG, Timeline, TweenedValue, ScoreEvents
 from score_render.elements.text_box import TextShadow
-from score_render.ingest import WebSocketHandler
+from score_render.ingest import WebSocketHandler, ScoreSnapshot
+from score_render.render.quality import QualityGovernor
+from score_render.render.memory import MemoryRegistry
+from score_render.metrics import REGISTRY, FrameMetrics, quality_collector, memory_collector, text_cache_collector
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -16,6 +19,12 @@ GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 MAGENTA = (255, 0, 255)
 
+USE_EX_SCORE = False
+MEMORY_BUDGET = 64 * 1024 * 1024  # bytes
+METRICS_PORT = 9100  # Prometheus text endpoint at http://127.0.0.1:9100/metrics; None disables it
+
+PARSE_ERRORS = REGISTRY.counter('score_render_parse_errors_total', "Score messages that failed to parse")
+
 
 def on_message(message, state):
     """
@@ -29,8 +38,10 @@ def on_message(message, state):
     # Update state with the new data
     try:
         state['msg'] = json.loads(message)
+        state['snapshot'] = ScoreSnapshot.from_message(state['msg'], use_ex_score=USE_EX_SCORE)
         state['time'] = datetime.now()
     except Exception as e:
+        PARSE_ERRORS.inc()
         print(f"Error parsing message: {e}")
 
 
@@ -48,6 +59,9 @@ def main():
     shadow_drop = TextShadow((0, 102, 255), 3, (3, 3))
     shadow_drop2 = TextShadow((0, 0, 0), 4, (4, 4))
 
+    # Formatted strings and rendered surfaces shared by every text box
+    text_cache = TextLayoutCache()
+
     # Create text boxes with effects
     text1 = TextBox(
         "text1",
@@ -56,7 +70,8 @@ def main():
         color=(255, 255, 255),
         bg_color=None,
         anchor="topleft",
-        shadow=[shadow_drop2, shadow_drop, shadow_outline]
+        shadow=[shadow_drop2, shadow_drop, shadow_outline],
+        cache=text_cache
     )
 
     text2 = TextBox(
@@ -66,7 +81,8 @@ def main():
         color=(255, 255, 255),
         bg_color=None,
         anchor="bottomright",
-        shadow=[shadow_drop2, shadow_drop, shadow_outline]
+        shadow=[shadow_drop2, shadow_drop, shadow_outline],
+        cache=text_cache
     )
 
     text3 = TextBox(
@@ -82,7 +98,8 @@ def main():
             TextShadow((0, 0, 0), 1, (1, 1)),
 
             # TextShadow((0, 0, 0), 3, (2, 2))
-        ]
+        ],
+        cache=text_cache
     )
 
     text4 = TextBox(
@@ -96,7 +113,8 @@ def main():
             TextShadow((0, 0, 0), 1, (1, 1)),
             TextShadow((0, 102, 255), 3, (2, 2)),
             TextShadow((0, 0, 0), 2, (1, 1)),
-        ]
+        ],
+        cache=text_cache
     )
 
     # Set positions
@@ -105,8 +123,36 @@ def main():
     text3.set_position(3, 40)
     text4.set_position(SCREEN_WIDTH-6, 125)
 
+    # Score counters glide between updates instead of snapping
+    timeline = Timeline()
+    p1_percent = TweenedValue(timeline, duration=0.4)
+    p2_percent = TweenedValue(timeline, duration=0.4)
+    p1_lead = TweenedValue(timeline, duration=0.4)
+    p2_lead = TweenedValue(timeline, duration=0.4)
+
+    # One-shot fireball behind the new leader's diff on every lead change
+    fireball = AnimationPNG(ASSETS_DIR / 'graphics' / 'fireballs' / 'PNGS' / 'type_01' / 'blue',
+                            duration=0.5,
+                            interpolation_frames=3,
+                            scale_to=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2),
+                            loopable=False)
+    fireball.current_time = fireball.duration  # Start idle
+    fireball_anchor = {'text': None}
+
+    def on_lead_changed(event):
+        fireball_anchor['text'] = text3 if event.player == 1 else text4
+        fireball.restart()
+
+    def on_song_started(event):
+        for counter in (p1_percent, p2_percent, p1_lead, p2_lead):
+            counter.snap(0)
+
+    events = ScoreEvents()
+    events.on('lead_changed', on_lead_changed)
+    events.on('song_started', on_song_started)
+
     # WebSocket setup
-    state = dict(msg=None, time=None)
+    state = dict(msg=None, snapshot=None, time=None)
     websocket_uri = "ws://192.168.1.101:9000"
     websocket_handler = WebSocketHandler(
         websocket_uri, lambda msg: on_message(msg, state)
@@ -120,15 +166,35 @@ def main():
     # Main loop
     running = True
     clock = pygame.time.Clock()
-    counter = 0
     FPS = 30
 
-    USE_EX_SCORE = False
+    # Shed shadow layers and fireball in-betweens when frames run long
+    governor = QualityGovernor(target_fps=FPS)
+    governor.register(text1, text2, text3, text4, fireball)
+
+    # Evict least recently drawn cached surfaces and fireball in-betweens beyond the budget
+    memory = MemoryRegistry(budget=MEMORY_BUDGET)
+    memory.register('text_cache', text_cache)
+    memory.register('fireball', fireball)
+    frame_number = 0
+
+    frame_metrics = FrameMetrics(FPS)
+    REGISTRY.register_collector(quality_collector(governor))
+    REGISTRY.register_collector(memory_collector(memory))
+    REGISTRY.register_collector(text_cache_collector(text_cache))
+    if METRICS_PORT is not None:
+        REGISTRY.serve(METRICS_PORT)
 
     try:
         while running:
 
-            clock.tick(FPS)
+            dt = clock.tick(FPS) / 1000
+            governor.record(clock.get_rawtime() / 1000)
+            frame_metrics.record(clock.get_rawtime() / 1000, dt)
+            frame_number += 1
+            if frame_number % FPS == 0:
+                memory.enforce()
+                REGISTRY.publish()
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -137,64 +203,59 @@ def main():
             screen.fill(RED)
 
             msg = state['msg']
+            snapshot = state['snapshot']
 
-            if msg is not None:
-                if msg['state'] == 'song_playing':
+            if snapshot is not None:
+                events.update(snapshot)
+
+                if snapshot.playing:
                     if USE_EX_SCORE and msg['song'] is None:
                         continue
 
+                    p1_score = snapshot.p1_score
+                    p2_score = snapshot.p2_score
+                    if p1_score is not None:
+                        p1_percent.set(snapshot.p1_percent)
+                    if p2_score is not None:
+                        p2_percent.set(snapshot.p2_percent)
+                    if p1_score is not None and p2_score is not None:
+                        p1_lead.set(max(0, snapshot.diff))
+                        p2_lead.set(max(0, -snapshot.diff))
+                    else:
+                        p1_lead.set(p1_score or 0)
+                        p2_lead.set(p2_score or 0)
 
-                    p1_max_score = 1000000
-                    p2_max_score = 1000000
-
-                    if USE_EX_SCORE:
-                        p1_info = msg['song']['p1_info']
-                        p2_info = msg['song']['p2_info']
-                        if p1_info is not None:
-                            p1_max_score = p1_info['max_ex_score']
-
-                        if p2_info is not None:
-                            p2_max_score = p2_info['max_ex_score']
+                    timeline.update(dt)
+                    fireball.update(dt)
 
-                    score = msg.get('score', None)
-                    if score is not None:
-                        p1_score = score.get('p1_score', None)
-                        p2_score = score.get('p2_score', None)
+                    if not fireball.finished and fireball_anchor['text'] is not None:
+                        fireball.draw(screen, fireball_anchor['text'].rect.center)
 
                     if p1_score is not None and p2_score is not None:
-                        p1_score = max(0, p1_score)
-                        p2_score = max(0, p2_score)
-                        diff = p1_score - p2_score
-                        text1.set_text(f"{100 * (p1_score / p1_max_score):.2f}%")
-                        text2.set_text(f"{100 * (p2_score / p2_max_score):.2f}%")
+                        diff = snapshot.diff
+                        text1.set_text(text_cache.format_percent(p1_percent.value))
+                        text2.set_text(text_cache.format_percent(p2_percent.value))
                         text1.draw(screen)
                         text2.draw(screen)
 
                         # p1 winning
                         if diff > 0:
-                            text3.set_text(f"+{diff}")
-                            text4.set_text(f"None")
+                            text3.set_text(text_cache.format_lead(p1_lead.value))
                             text3.draw(screen)
                         elif diff < 0:
-                            text3.set_text(f"None")
-                            text4.set_text(f"+{-diff}")
+                            text4.set_text(text_cache.format_lead(p2_lead.value))
                             text4.draw(screen)
-                        else:
-                            text3.set_text(f"None")
-                            text3.set_text(f"None")
 
                     # Only P1 is playing
                     elif p1_score is not None:
-                        p1_score = max(0, p1_score)
-                        text1.set_text(f"{100 * (p1_score / p1_max_score):.2f}%")
-                        text3.set_text(f"+{p1_score}")
+                        text1.set_text(text_cache.format_percent(p1_percent.value))
+                        text3.set_text(text_cache.format_lead(p1_lead.value))
                         text1.draw(screen)
                         text3.draw(screen)
 
                     elif p2_score is not None:
-                        p2_score = max(0, p2_score)
-                        text2.set_text(f"{100 * (p2_score / p2_max_score):.2f}%")
-                        text4.set_text(f"+{p2_score}")
+                        text2.set_text(text_cache.format_percent(p2_percent.value))
+                        text4.set_text(text_cache.format_lead(p2_lead.value))
                         text2.draw(screen)
                         text4.draw(screen)
                     else:
@@ -207,6 +268,7 @@ def main():
     finally:
         print('Shutting down...')
         websocket_handler.stop()
+        REGISTRY.stop()
         pygame.quit()
 
 
@@ -0,0 +1,98 @@
+import time
+
+import pygame
+
+from score_render import ASSETS_DIR
+from score_render.render import PanelSpec, RenderSupervisor
+
+PANEL_WIDTH = 288
+PANEL_HEIGHT = 162
+RED = (255, 0, 0)
+
+
+def player_panel(player):
+    """
+    Build a layout factory for a single-player score panel.
+
+    The closure itself cannot be pickled, so workers are given the module-level `p1_panel` and
+    `p2_panel` wrappers instead.
+    """
+    def factory(size):
+        # Imported inside the worker, after pygame is initialized
+        from score_render.elements import TextBox
+        from score_render.elements.text_box import TextShadow
+
+        width, height = size
+        score_text = TextBox(
+            "",
+            font=ASSETS_DIR / 'fonts' / 'ChangaOne-Italic.ttf',
+            font_size=42,
+            color=(255, 255, 255),
+            anchor="center",
+            shadow=[TextShadow((0, 0, 0), 4, (4, 4)), TextShadow((0, 102, 255), 3, (3, 3)), TextShadow((0, 0, 0), 2, (1, 1))]
+        )
+        score_text.set_position(width // 2, height // 2)
+
+        def render(screen, snapshot, dt):
+            screen.fill(RED)
+            if snapshot is None or not snapshot.playing:
+                return
+            percent = snapshot.p1_percent if player == 1 else snapshot.p2_percent
+            if percent is None:
+                return
+            score_text.set_text(f"{percent:.2f}%")
+            score_text.draw(screen)
+
+        return render
+    return factory
+
+
+def p1_panel(size):
+    return player_panel(1)(size)
+
+
+def p2_panel(size):
+    return player_panel(2)(size)
+
+
+def main():
+    panels = [
+        PanelSpec('p1', p1_panel, (PANEL_WIDTH, PANEL_HEIGHT)),
+        PanelSpec('p2', p2_panel, (PANEL_WIDTH, PANEL_HEIGHT)),
+    ]
+    supervisor = RenderSupervisor("ws://192.168.1.101:9000", panels)
+    supervisor.start()
+
+    # Preview window compositing every panel side by side
+    pygame.init()
+    screen = pygame.display.set_mode((PANEL_WIDTH * len(panels), PANEL_HEIGHT))
+    pygame.display.set_caption("AFC Score Panels")
+    clock = pygame.time.Clock()
+    last_poll = 0.0
+
+    running = True
+    try:
+        while running:
+            clock.tick(30)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+
+            now = time.monotonic()
+            if now - last_poll > 0.5:
+                supervisor.poll()
+                last_poll = now
+
+            for i, panel in enumerate(panels):
+                frame = supervisor.frame_buffer(panel.name).read_surface()
+                if frame is not None:
+                    screen.blit(frame, (i * PANEL_WIDTH, 0))
+            pygame.display.flip()
+    finally:
+        print('Shutting down...')
+        supervisor.stop()
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import sys
+from pathlib import Path
+from threading import Thread
+
+import pygame
+
+from score_render.ingest import WebSocketHandler, ScoreSnapshot
+from score_render.render.layout import OverlayLayout, LayoutWatcher
+from score_render.metrics import REGISTRY, FrameMetrics, text_cache_collector
+
+DEFAULT_LAYOUT = Path(__file__).parent / 'layouts' / 'afc.json'
+METRICS_PORT = 9101  # Prometheus text endpoint at http://127.0.0.1:9101/metrics; None disables it
+
+PARSE_ERRORS = REGISTRY.counter('score_render_parse_errors_total', "Score messages that failed to parse")
+
+
+def on_message(message, state):
+    """
+    Callback function to handle incoming WebSocket messages.
+
+    Args:
+        message (str): The message received from the WebSocket server.
+        state (dict): Shared state for the game.
+    """
+    try:
+        state['snapshot'] = ScoreSnapshot.from_message(message)
+    except Exception as e:
+        PARSE_ERRORS.inc()
+        print(f"Error parsing message: {e}")
+
+
+def main():
+    layout_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_LAYOUT
+
+    pygame.init()
+
+    # The display must exist before fonts and animation frames are loaded
+    pygame.display.set_mode((1, 1))
+    layout = OverlayLayout()
+    watcher = LayoutWatcher(layout, layout_path)
+    try:
+        watcher.start()
+    except Exception as e:
+        print(f"Error loading layout {layout_path}: {e}")
+        pygame.quit()
+        sys.exit(1)
+
+    screen = pygame.display.set_mode(layout.size)
+    pygame.display.set_caption(f"Score Renderer ({layout_path.name})")
+
+    # WebSocket setup
+    state = dict(snapshot=None)
+    websocket_uri = "ws://192.168.1.101:9000"
+    websocket_handler = WebSocketHandler(
+        websocket_uri, lambda msg: on_message(msg, state)
+    )
+    websocket_thread = Thread(target=websocket_handler.start)
+    websocket_thread.daemon = True
+    websocket_thread.start()
+
+    running = True
+    clock = pygame.time.Clock()
+    FPS = 30
+
+    frame_number = 0
+
+    frame_metrics = FrameMetrics(FPS)
+    REGISTRY.register_collector(text_cache_collector(layout.text_cache))
+    REGISTRY.gauge('score_render_culled_elements', "Layout elements skipped as off-screen in the last frame",
+                   function=lambda: layout.viewport.culled)
+    if METRICS_PORT is not None:
+        REGISTRY.serve(METRICS_PORT)
+
+    try:
+        while running:
+            dt = clock.tick(FPS) / 1000
+            frame_metrics.record(clock.get_rawtime() / 1000, dt)
+            frame_number += 1
+            if frame_number % FPS == 0:
+                REGISTRY.publish()
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+
+            # Edits to the layout file are applied here, between frames
+            if watcher.poll() is not None and screen.get_size() != layout.size:
+                screen = pygame.display.set_mode(layout.size)
+
+            layout.update(state['snapshot'], dt)
+            layout.draw(screen)
+            pygame.display.flip()
+    finally:
+        print('Shutting down...')
+        watcher.stop()
+        websocket_handler.stop()
+        REGISTRY.stop()
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Startup-time benchmark: import cost of each score_render entry point and time to first frame.
+
+Every measurement runs in a fresh interpreter, so module caches from earlier measurements don't
+hide import costs. Run from the repository root:
+
+    python benchmarks/startup.py [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+IMPORT_TARGETS = [
+    ('score_render', 'import score_render'),
+    ('score_render.elements', 'import score_render.elements'),
+    ('score_render.ingest', 'import score_render.ingest'),
+    ('score_render.render', 'import score_render.render'),
+    ('ingest.ScoreSnapshot', 'from score_render.ingest import ScoreSnapshot'),
+    ('elements.Timeline', 'from score_render.elements import Timeline'),
+    ('elements.TextBox', 'from score_render.elements import TextBox'),
+    ('render.worker', 'from score_render.render.worker import run_worker'),
+    ('ingest.WebSocketHandler', 'from score_render.ingest import WebSocketHandler'),
+    ('pygame + numpy (reference)', 'import pygame, numpy'),
+]
+
+FIRST_FRAME = """
+import pygame
+from score_render import ASSETS_DIR
+from score_render.elements import TextBox
+from score_render.elements.text_box import TextShadow
+
+pygame.init()
+pygame.display.set_mode((1, 1))
+screen = pygame.Surface((288, 162))
+text = TextBox("99.99%", font=ASSETS_DIR / 'fonts' / 'ChangaOne-Italic.ttf', font_size=42, color=(255, 255, 255),
+               shadow=[TextShadow((0, 0, 0), 4, (4, 4)), TextShadow((0, 102, 255), 3, (3, 3))])
+text.set_position(3, 3)
+screen.fill((255, 0, 0))
+text.draw(screen)
+"""
+
+TIMER = """
+import time
+_start = time.perf_counter()
+{code}
+print(time.perf_counter() - _start)
+"""
+
+
+def measure(code, repeat):
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1',
+               PYTHONPATH=os.pathsep.join(filter(None, [str(REPO_ROOT), os.environ.get('PYTHONPATH')])))
+    samples = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-c', TIMER.format(code=code)], env=env, capture_output=True, text=True)
+        if result.returncode != 0:
+            return None, result.stderr.strip().splitlines()[-1]
+        samples.append(float(result.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples), None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Fresh interpreters per measurement (median is reported)')
+    args = parser.parse_args()
+
+    rows = [(name, *measure(code, args.repeat)) for name, code in IMPORT_TARGETS]
+    rows.append(('import + first frame', *measure(FIRST_FRAME, args.repeat)))
+
+    width = max(len(name) for name, _, _ in rows)
+    for name, seconds, error in rows:
+        value = f"{1000 * seconds:8.1f} ms" if error is None else f"failed: {error}"
+        print(f"{name:<{width}}  {value}")
+
+
+if __name__ == "__main__":
+    main()
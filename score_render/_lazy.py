@@ -0,0 +1,30 @@
+import importlib
+import sys
+
+
+def lazy_exports(package, exports):
+    """
+    Build module-level `__getattr__` and `__dir__` functions that import submodules on first use.
+
+    Keeps heavy dependencies (pygame, NumPy, websockets) out of package `__init__` files: a tool that
+    only needs one name pays only for the submodule defining it.
+
+    Args:
+        package (str): `__name__` of the package.
+        exports (dict): Public name -> relative submodule (e.g. '.text_box') defining it.
+
+    Returns:
+        tuple: (__getattr__, __dir__) to assign at module level.
+    """
+    def __getattr__(name):
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule, package), name)
+        setattr(sys.modules[package], name, value)  # Later lookups bypass __getattr__
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
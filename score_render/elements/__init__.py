@@ -1,5 +1,16 @@
-from .text_box import TextBox
-from .particle_trail import ParticleTrail
-from .animation import AnimationPNG
+from score_render._lazy import lazy_exports
 
-__all__ = ['TextBox', 'ParticleTrail', 'AnimationPNG']
\ No newline at end of file
+# Submodules pull in pygame and/or NumPy, so they are only imported when one of their names is used
+_EXPORTS = {
+    'TextBox': '.text_box',
+    'TextLayoutCache': '.text_cache',
+    'ParticleTrail': '.particle_trail',
+    'AnimationPNG': '.animation',
+    'Timeline': '.timeline',
+    'TweenedValue': '.timeline',
+    'ScoreEvents': '.timeline',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
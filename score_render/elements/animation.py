@@ -1,9 +1,313 @@
+import time
+from collections import OrderedDict
+
 import pygame
 import os
 import numpy as np
 
+from .footprint import surface_bytes
+
+STORAGE_MODES = ('rgba', 'intensity')
+
+
+class BakedFrames:
+    def __init__(self, source_frames, interpolation_frames, loopable):
+        """
+        Original animation frames plus interpolated in-betweens, baked on demand.
+
+        In-between frames can be evicted to save memory and are transparently re-interpolated
+        from the original frames the next time they are needed. Originals are never evicted.
+
+        Args:
+            source_frames (list[pygame.Surface]): Original (already scaled) frames, all the same size.
+            interpolation_frames (int): Number of interpolated frames between each original frame.
+            loopable (bool): Whether to interpolate from the last frame back to the first.
+        """
+        self.source_frames = source_frames
+        self.segment = interpolation_frames + 1
+        segments = max(0, len(source_frames) - (not loopable))
+        self.frames = [None] * (segments * self.segment)
+        self.last_used = [0.0] * len(self.frames)
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def frame_size(self):
+        """tuple: (width, height) shared by every frame."""
+        return self.source_frames[0].get_size() if self.source_frames else (0, 0)
+
+    def __getitem__(self, index):
+        frame = self.frames[index]
+        if frame is None:
+            frame = self.frames[index] = self.bake(index)
+        return frame
+
+    def bake(self, index):
+        """
+        Build a single frame.
+
+        Args:
+            index (int): Index of the frame within the baked sequence.
+
+        Returns:
+            pygame.Surface: The frame. For original frames this is the source surface itself.
+        """
+        i, j = divmod(index, self.segment)
+        frame1 = self.source_frames[i]
+        if j == 0:
+            return frame1
+        frame2 = self.source_frames[(i + 1) % len(self.source_frames)]  # Loop to the first frame
+
+        # Convert frames to numpy arrays
+        array1 = pygame.surfarray.pixels3d(frame1)
+        array2 = pygame.surfarray.pixels3d(frame2)
+        alpha1 = pygame.surfarray.pixels_alpha(frame1)
+        alpha2 = pygame.surfarray.pixels_alpha(frame2)
+
+        alpha = j / self.segment
+        interpolated_array = (1 - alpha) * array1 + alpha * array2
+        interpolated_alpha = (1 - alpha) * alpha1 + alpha * alpha2
+        del array1, array2, alpha1, alpha2  # Release the surface locks
+
+        # Create surface from interpolated array
+        interpolated_surface = pygame.Surface(frame1.get_size(), pygame.SRCALPHA)
+        pygame.surfarray.blit_array(interpolated_surface, interpolated_array)
+        pygame.surfarray.pixels_alpha(interpolated_surface)[:] = interpolated_alpha
+        return interpolated_surface
+
+    def bake_all(self):
+        """Bake every frame that isn't baked yet."""
+        for index in range(len(self.frames)):
+            self[index]
+
+    def memory_usage(self):
+        """
+        Report the memory held by the frames.
+
+        Returns:
+            list[tuple]: (key, bytes, last_used) per held surface. last_used is None for original
+            frames, which cannot be evicted.
+        """
+        usage = [(('source', i), surface_bytes(frame), None) for i, frame in enumerate(self.source_frames)]
+        for index, frame in enumerate(self.frames):
+            if frame is not None and index % self.segment:
+                usage.append((index, surface_bytes(frame), self.last_used[index]))
+        return usage
+
+    def evict(self, key):
+        """
+        Drop a baked in-between frame. It is re-interpolated on next use.
+
+        Args:
+            key (int): Frame index, as reported by `memory_usage`.
+
+        Returns:
+            int: Bytes released.
+        """
+        frame = self.frames[key]
+        if frame is None or not key % self.segment:
+            return 0
+        self.frames[key] = None
+        return surface_bytes(frame)
+
+
+def _tint_ramp(color):
+    """
+    Color ramp running from black through `color` (at mid intensity) to white.
+
+    Args:
+        color (tuple): RGB tint.
+
+    Returns:
+        np.ndarray: (256, 3) uint8 lookup table indexed by intensity.
+    """
+    levels = np.arange(256, dtype=np.float32)[:, None]
+    tint = np.asarray(color, dtype=np.float32)[None, :]
+    dark = tint * levels / 127
+    light = tint + (255 - tint) * (levels - 127) / 128
+    return np.clip(np.where(levels <= 127, dark, light), 0, 255).astype(np.uint8)
+
+
+class IntensityFrames:
+    def __init__(self, intensity, alpha, ramp, interpolation_frames, loopable, hot_frames=None, baked=None):
+        """
+        Compact frame store: one intensity and one alpha channel per frame plus a shared color ramp.
+
+        Frames take 2 bytes per pixel instead of 4, and in-betweens are interpolated in that compact
+        form. Frames are expanded to RGBA surfaces through the ramp only when drawn, and kept in a
+        small LRU of expanded surfaces. Swapping the ramp recolors the whole animation (see `tinted`).
+
+        Args:
+            intensity (list[np.ndarray]): (w, h) uint8 intensity of each original frame.
+            alpha (list[np.ndarray]): (w, h) uint8 alpha of each original frame.
+            ramp (np.ndarray): (256, 3) uint8 lookup table from intensity to RGB.
+            interpolation_frames (int): Number of interpolated frames between each original frame.
+            loopable (bool): Whether to interpolate from the last frame back to the first.
+            hot_frames (int): Number of expanded RGBA surfaces kept. If None, every frame is kept once
+                drawn, so a looping animation expands each frame only once (expanded surfaces can still
+                be evicted through `MemoryRegistry`). Smaller values save memory but re-expand frames
+                on every loop once the animation has more frames than that.
+            baked (list): Compact in-between storage shared with another store of the same frames.
+        """
+        self.intensity = intensity
+        self.alpha = alpha
+        self.ramp = ramp
+        self.segment = interpolation_frames + 1
+        self.loopable = loopable
+        self.hot_frames = hot_frames
+        segments = max(0, len(intensity) - (not loopable))
+        self.owns_data = baked is None  # Only the store that created the compact data reports it
+        self.baked = baked if baked is not None else [None] * (segments * self.segment)
+        self.last_used = [0.0] * len(self.baked)
+        self.hot = OrderedDict()
+
+    @classmethod
+    def from_surfaces(cls, surfaces, interpolation_frames, loopable, hot_frames=None):
+        """
+        Compress RGBA frames, estimating the color ramp from their pixels.
+
+        Each intensity level maps to the alpha-weighted mean color of the pixels with that
+        intensity; levels that never occur are linearly interpolated.
+
+        Args:
+            surfaces (list[pygame.Surface]): Original (already scaled) frames, all the same size.
+            interpolation_frames (int): Number of interpolated frames between each original frame.
+            loopable (bool): Whether to interpolate from the last frame back to the first.
+            hot_frames (int): Number of expanded RGBA surfaces kept. If None, every frame.
+
+        Returns:
+            IntensityFrames: The compact store.
+        """
+        intensity, alpha = [], []
+        color_sums = np.zeros((256, 3))
+        weights = np.zeros(256)
+        for surface in surfaces:
+            rgb = pygame.surfarray.array3d(surface).astype(np.float32)
+            frame_alpha = pygame.surfarray.array_alpha(surface)
+            luma = np.clip(rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32) + 0.5, 0, 255).astype(np.uint8)
+            intensity.append(luma)
+            alpha.append(frame_alpha)
+
+            flat_luma = luma.ravel()
+            flat_weight = frame_alpha.ravel().astype(np.float64)
+            weights += np.bincount(flat_luma, weights=flat_weight, minlength=256)
+            for channel in range(3):
+                color_sums[:, channel] += np.bincount(flat_luma, weights=rgb[:, :, channel].ravel() * flat_weight, minlength=256)
+
+        ramp = np.zeros((256, 3), dtype=np.uint8)
+        present = np.flatnonzero(weights > 0)
+        if present.size:
+            levels = np.arange(256)
+            for channel in range(3):
+                ramp[:, channel] = np.interp(levels, present, color_sums[present, channel] / weights[present]).round()
+        return cls(intensity, alpha, ramp, interpolation_frames, loopable, hot_frames)
+
+    def tinted(self, color):
+        """
+        Share these frames with a different color ramp.
+
+        Args:
+            color (tuple): RGB tint, placed at mid intensity between black and white.
+
+        Returns:
+            IntensityFrames: A store sharing all compact data with this one.
+        """
+        return IntensityFrames(self.intensity, self.alpha, _tint_ramp(color), self.segment - 1, self.loopable,
+                               self.hot_frames, baked=self.baked)
+
+    def __len__(self):
+        return len(self.baked)
+
+    @property
+    def frame_size(self):
+        """tuple: (width, height) shared by every frame."""
+        return self.intensity[0].shape if self.intensity else (0, 0)
+
+    def compact(self, index):
+        """
+        Get the compact (intensity, alpha) arrays of a frame, interpolating in-betweens on demand.
+
+        Args:
+            index (int): Index of the frame within the baked sequence.
+
+        Returns:
+            tuple: (intensity, alpha) uint8 arrays.
+        """
+        i, j = divmod(index, self.segment)
+        if j == 0:
+            return self.intensity[i], self.alpha[i]
+        if self.baked[index] is None:
+            k = (i + 1) % len(self.intensity)  # Loop to the first frame
+            t = j / self.segment
+            self.baked[index] = (
+                ((1 - t) * self.intensity[i] + t * self.intensity[k] + 0.5).astype(np.uint8),
+                ((1 - t) * self.alpha[i] + t * self.alpha[k] + 0.5).astype(np.uint8),
+            )
+        return self.baked[index]
+
+    def __getitem__(self, index):
+        surface = self.hot.get(index)
+        if surface is not None:
+            self.hot.move_to_end(index)
+            return surface
+
+        intensity, alpha = self.compact(index)
+        surface = pygame.Surface(intensity.shape, pygame.SRCALPHA)
+        pygame.surfarray.blit_array(surface, self.ramp[intensity])
+        pygame.surfarray.pixels_alpha(surface)[:] = alpha
+        self.hot[index] = surface
+        if self.hot_frames is not None and len(self.hot) > self.hot_frames:
+            self.hot.popitem(last=False)
+        return surface
+
+    def bake_all(self):
+        """Interpolate every compact in-between that isn't baked yet."""
+        for index in range(len(self.baked)):
+            self.compact(index)
+
+    def memory_usage(self):
+        """
+        Report the memory held by the compact frames and expanded surfaces.
+
+        Compact data shared with tinted copies is only reported by the store that created it.
+
+        Returns:
+            list[tuple]: (key, bytes, last_used) per array pair or surface. last_used is None for the
+            original frames, which cannot be evicted.
+        """
+        usage = []
+        if self.owns_data:
+            usage += [(('source', i), self.intensity[i].nbytes + self.alpha[i].nbytes, None) for i in range(len(self.intensity))]
+            for index, frame in enumerate(self.baked):
+                if frame is not None:
+                    usage.append((index, frame[0].nbytes + frame[1].nbytes, self.last_used[index]))
+        for index, surface in self.hot.items():
+            usage.append((('hot', index), surface_bytes(surface), self.last_used[index]))
+        return usage
+
+    def evict(self, key):
+        """
+        Drop a compact in-between or an expanded surface. Either is rebuilt on next use.
+
+        Args:
+            key: Key as reported by `memory_usage`.
+
+        Returns:
+            int: Bytes released.
+        """
+        if isinstance(key, tuple) and key[0] == 'hot':
+            surface = self.hot.pop(key[1], None)
+            return surface_bytes(surface) if surface is not None else 0
+        if isinstance(key, int) and self.owns_data and self.baked[key] is not None:
+            frame, self.baked[key] = self.baked[key], None
+            return frame[0].nbytes + frame[1].nbytes
+        return 0
+
+
 class AnimationPNG:
-    def __init__(self, folder_path, duration, interpolation_frames=3, scale_to=None, maintain_aspect_ratio=True, loopable=True):
+    def __init__(self, folder_path, duration, interpolation_frames=3, scale_to=None, maintain_aspect_ratio=True, loopable=True, baked_frames=None,
+                 storage='rgba', tint=None, hot_frames=None):
         """
         Initialize the animation with optional frame interpolation, scaling, and center-based positioning.
 
@@ -13,18 +317,44 @@ class AnimationPNG:
             interpolation_frames (int): Number of interpolated frames between each original frame.
             scale_to (tuple): Desired (width, height) to scale all frames to. If None, no scaling is performed.
             maintain_aspect_ratio (bool): Whether to maintain aspect ratio when scaling.
+            loopable (bool): Whether the animation loops (and interpolates from the last frame back to the first).
+            baked_frames (BakedFrames, IntensityFrames): Frames baked for the same parameters, e.g. another
+                instance's `baked_frames`, to share. If given, nothing is loaded from `folder_path`.
+            storage (str): 'rgba' keeps every frame as a 32-bit surface. 'intensity' keeps frames as 8-bit
+                intensity plus alpha with a per-animation color ramp, expanding to RGBA only when drawn.
+            tint (tuple): RGB color to recolor the animation with. Requires 'intensity' storage.
+            hot_frames (int): With 'intensity' storage, number of frames kept expanded to RGBA after
+                being drawn. If None, every frame, so looping playback only expands each frame once.
+                Only used when loading from `folder_path`.
         """
+        if storage not in STORAGE_MODES:
+            raise ValueError(f"Unknown storage '{storage}'. Valid options: {list(STORAGE_MODES)}")
         self.loopable = loopable
-        self.frames = self.load_and_process_frames(folder_path, interpolation_frames, scale_to, maintain_aspect_ratio)
+        self.interpolation_frames = interpolation_frames
+        if baked_frames is None:
+            baked_frames = self.load_and_process_frames(folder_path, interpolation_frames, scale_to, maintain_aspect_ratio, storage,
+                                                        hot_frames)
+        if tint is not None:
+            if not isinstance(baked_frames, IntensityFrames):
+                raise ValueError("Tinting requires storage='intensity'")
+            baked_frames = baked_frames.tinted(tint)
+        self.baked_frames = baked_frames
+        self.frame_indices = list(range(len(baked_frames)))
         self.duration = duration
-        self.frame_count = len(self.frames)
+        self.frame_count = len(self.frame_indices)
         self.current_time = 0
         self.playing = True  # Whether the animation is playing
 
         # Save the animation's width and height based on the first frame
-        self.width, self.height = self.frames[0].get_size() if self.frames else (0, 0)
+        self.width, self.height = self.baked_frames[0].get_size() if self.frame_count else (0, 0)
+
+    @property
+    def frames(self):
+        """list[pygame.Surface]: The frames currently played back, re-baking any that were evicted."""
+        return [self.baked_frames[index] for index in self.frame_indices]
 
-    def load_and_process_frames(self, folder_path, interpolation_frames, scale_to, maintain_aspect_ratio):
+    def load_and_process_frames(self, folder_path, interpolation_frames, scale_to, maintain_aspect_ratio, storage='rgba',
+                                hot_frames=None):
         """
         Load frames from the specified folder, interpolate, and optionally scale them.
 
@@ -33,11 +363,12 @@ class AnimationPNG:
             interpolation_frames (int): Number of interpolated frames to generate between each original frame.
             scale_to (tuple): Desired (width, height) for scaling.
             maintain_aspect_ratio (bool): Whether to maintain aspect ratio when scaling.
+            storage (str): Frame storage mode, 'rgba' or 'intensity'.
+            hot_frames (int): Expanded RGBA surfaces kept with 'intensity' storage. If None, every frame.
 
         Returns:
-            list: A list of Pygame surfaces, including interpolated frames.
+            BakedFrames, IntensityFrames: The frames, including interpolated frames.
         """
-        frames = []
         file_list = sorted(
             [f for f in os.listdir(folder_path) if f.endswith(".png")]
         )
@@ -48,29 +379,48 @@ class AnimationPNG:
             for file in file_list
         ]
 
-        # Interpolate between consecutive frames
-        for i in range(len(original_frames) - (not self.loopable)):
-            frame1 = original_frames[i]
-            frame2 = original_frames[(i + 1) % len(original_frames)]  # Loop to the first frame
+        # Interpolate between consecutive frames up front, so playback never stalls on a bake
+        if storage == 'intensity':
+            frames = IntensityFrames.from_surfaces(original_frames, interpolation_frames, self.loopable, hot_frames)
+        else:
+            frames = BakedFrames(original_frames, interpolation_frames, self.loopable)
+        frames.bake_all()
+        return frames
 
-            # Convert frames to numpy arrays
-            array1 = pygame.surfarray.pixels3d(frame1)
-            array2 = pygame.surfarray.pixels3d(frame2)
-            alpha1 = pygame.surfarray.pixels_alpha(frame1)
-            alpha2 = pygame.surfarray.pixels_alpha(frame2)
+    def tinted(self, color):
+        """
+        Create a recolored copy of this animation sharing all frame data. Requires 'intensity' storage.
 
-            for j in range(interpolation_frames + 1):
-                alpha = j / (interpolation_frames + 1)
-                interpolated_array = (1 - alpha) * array1 + alpha * array2
-                interpolated_alpha = (1 - alpha) * alpha1 + alpha * alpha2
+        Args:
+            color (tuple): RGB tint, placed at mid intensity between black and white.
 
-                # Create surface from interpolated array
-                interpolated_surface = pygame.Surface(frame1.get_size(), pygame.SRCALPHA)
-                pygame.surfarray.blit_array(interpolated_surface, interpolated_array)
-                pygame.surfarray.pixels_alpha(interpolated_surface)[:] = interpolated_alpha
-                frames.append(interpolated_surface)
+        Returns:
+            AnimationPNG: The recolored animation.
+        """
+        return AnimationPNG(None, self.duration, self.interpolation_frames, loopable=self.loopable,
+                            baked_frames=self.baked_frames, tint=color)
 
-        return frames
+    def set_interpolation_frames(self, interpolation_frames):
+        """
+        Play back with fewer in-between frames than were baked, without re-baking.
+
+        Args:
+            interpolation_frames (int): In-between frames per original frame. None, or any value at or
+                above the baked count, restores every baked frame.
+        """
+        baked = self.interpolation_frames
+        if interpolation_frames is None or interpolation_frames >= baked:
+            self.frame_indices = list(range(len(self.baked_frames)))
+        else:
+            # Each original frame starts a segment of (baked + 1) frames; keep evenly spaced ones
+            segment = baked + 1
+            offsets = [round(j * segment / (interpolation_frames + 1)) for j in range(interpolation_frames + 1)]
+            self.frame_indices = [
+                start + offset
+                for start in range(0, len(self.baked_frames), segment)
+                for offset in offsets
+            ]
+        self.frame_count = len(self.frame_indices)
 
     def scale_frame(self, frame, scale_to, maintain_aspect_ratio):
         """
@@ -122,21 +472,51 @@ class AnimationPNG:
         Returns:
             pygame.Surface: The current animation frame.
         """
-        if not self.frames:
+        if not self.frame_count:
             return None
-        # Calculate the current frame index
+        # Calculate the current frame index, holding the last frame once a one-shot animation ends
         frame_index = int((self.current_time / self.duration) * self.frame_count)
-        return self.frames[frame_index]
+        baked_index = self.frame_indices[min(frame_index, self.frame_count - 1)]
+        self.baked_frames.last_used[baked_index] = time.monotonic()
+        return self.baked_frames[baked_index]
+
+    @property
+    def finished(self):
+        """bool: Whether a non-loopable animation has played through to its end."""
+        return not self.loopable and self.current_time >= self.duration
+
+    def restart(self):
+        """Rewind the animation to its first frame and start playing."""
+        self.current_time = 0
+        self.playing = True
+
+    def get_bounds(self, position):
+        """
+        Get the screen area covered by the animation when drawn at a position.
+
+        Args:
+            position (tuple): The (x, y) position the animation is centered at.
+
+        Returns:
+            pygame.Rect: Bounding box in screen coordinates.
+        """
+        bounds = pygame.Rect((0, 0), self.baked_frames.frame_size)
+        bounds.center = position
+        return bounds
 
     def draw(self, screen, position):
         """
         Draw the current frame on the screen, centered at the given position.
 
+        Nothing is baked or blitted when the frame would land entirely outside the screen's clip area.
+
         Args:
             screen (pygame.Surface): The surface to draw the animation on.
             position (tuple): The (x, y) position to center the animation.
         """
+        frame_rect = self.get_bounds(position)
+        if not frame_rect.colliderect(screen.get_clip()):
+            return
         frame = self.get_frame()
         if frame:
-            frame_rect = frame.get_rect(center=position)
             screen.blit(frame, frame_rect)
@@ -0,0 +1,36 @@
+import sys
+
+import pygame
+
+
+def surface_bytes(surface):
+    """
+    Pixel memory held by a surface (width x height x bytes per pixel).
+
+    Args:
+        surface (pygame.Surface): The surface.
+
+    Returns:
+        int: Size in bytes.
+    """
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+def value_bytes(value):
+    """
+    Approximate memory held by a cached value, counting surfaces by their pixel data.
+
+    Args:
+        value: A surface, a str/bytes, a (nested) tuple or list of those, or any other object.
+
+    Returns:
+        int: Approximate size in bytes.
+    """
+    if isinstance(value, pygame.Surface):
+        return surface_bytes(value)
+    if isinstance(value, (tuple, list)):
+        return sum(value_bytes(item) for item in value)
+    if value is None:
+        return 0
+    return sys.getsizeof(value)
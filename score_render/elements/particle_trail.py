@@ -1,20 +1,67 @@
 import pygame
-import random
+import numpy as np
+
+BLEND_MODES = ('alpha', 'add', 'max')
+SPAWN_SHAPES = ('point', 'line', 'circle')
+VELOCITY_DISTRIBUTIONS = ('uniform', 'normal', 'radial')
+
+# Columns of the particle array
+_X, _Y, _VX, _VY, _LIFE, _LIFETIME, _RAMP = range(7)
+_COLUMNS = 7
+
+# Number of samples each color ramp is resampled to
+RAMP_STEPS = 32
+
+# Particle footprint: a radius 2 circle drawn into a 4x4 sprite
+PARTICLE_SIZE = 4
+
+
+def _particle_mask():
+    surface = pygame.Surface((PARTICLE_SIZE, PARTICLE_SIZE), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (255, 255, 255, 255), (PARTICLE_SIZE // 2, PARTICLE_SIZE // 2), PARTICLE_SIZE // 2)
+    return pygame.surfarray.array_alpha(surface) / 255
+
 
 class ParticleTrail:
-    def __init__(self, color, max_particles=100, particle_lifetime=60):
+    def __init__(self, color, max_particles=100, particle_lifetime=60, seed=None, blend='alpha', bounds=None, cull_margin=0):
         """
         Initialize the particle trail effect.
 
+        Particles are stored as rows of a single NumPy array, so emitting, simulating and culling a
+        burst of thousands of particles are a handful of array operations.
+
         Args:
             color (tuple): RGB color of the particles.
             max_particles (int): Maximum number of particles to retain.
             particle_lifetime (int): Number of frames each particle lasts.
+            seed (int): Seed for the particle velocities, for reproducible trails. If None, seeded from the OS.
+            blend (str): How particles are composited onto the screen:
+                'alpha': Each particle is alpha blended, fading out over its life.
+                'add': Particle colors are summed (saturating), so overlapping particles glow.
+                'max': Each pixel takes the brightest particle covering it.
+            bounds (pygame.Rect): Visible area. Particles that have left it (plus `cull_margin`) and keep
+                moving away can never be seen again and are removed. If None, the clip area of the
+                surface last drawn on is used.
+            cull_margin (int): Extra distance in pixels particles may travel past `bounds` before removal.
         """
+        if blend not in BLEND_MODES:
+            raise ValueError(f"Unknown blend mode '{blend}'. Valid options: {list(BLEND_MODES)}")
+
         self.color = color
         self.max_particles = max_particles
         self.particle_lifetime = particle_lifetime
-        self.particles = []
+        self.blend = blend
+        self.bounds = pygame.Rect(bounds) if bounds is not None else None
+        self.cull_margin = cull_margin
+        self.screen_clip = None
+        self.particles = np.empty((0, _COLUMNS))
+        self.random = np.random.default_rng(seed)
+
+        # Ramp 0 always follows `self.color`; further ramps are added by `emit_batch`
+        self.ramps = np.zeros((1, RAMP_STEPS, 3), dtype=np.float32)
+        self.ramp_ids = {}
+        self.sprites = {}
+        self.mask = None
 
     def emit(self, x, y):
         """
@@ -24,30 +71,163 @@ class ParticleTrail:
             x (int): X-coordinate of the particle's starting position.
             y (int): Y-coordinate of the particle's starting position.
         """
-        particle = {
-            "x": x,
-            "y": y,
-            "vx": random.uniform(-1, 1),  # Random horizontal drift
-            "vy": random.uniform(1, 3),  # Downward velocity
-            "life": self.particle_lifetime
-        }
-        self.particles.append(particle)
+        self.emit_batch(1, x, y)
 
-        # Limit the number of particles
-        if len(self.particles) > self.max_particles:
-            self.particles.pop(0)
+    def emit_batch(self, n, x, y, shape='point', extent=0, angle=0, velocity='uniform',
+                   vx=(-1, 1), vy=(1, 3), speed=(1, 3), lifetime=None, color_ramp=None):
+        """
+        Emit `n` particles at once.
+
+        Args:
+            n (int): Number of particles.
+            x (float): X-coordinate of the spawn shape's center.
+            y (float): Y-coordinate of the spawn shape's center.
+            shape (str): Where particles spawn:
+                'point': All at (x, y).
+                'line': Uniformly along a line of length 2 * extent through (x, y), rotated by `angle`.
+                'circle': Uniformly inside a disc of radius `extent` around (x, y).
+            extent (float): Half-length of the line or radius of the circle.
+            angle (float): Rotation of the line in degrees (0 is horizontal).
+            velocity (str): How initial velocities are drawn, in pixels per frame:
+                'uniform': vx and vy uniform within the `vx` and `vy` ranges.
+                'normal': vx and vy normally distributed, centered in the `vx` and `vy` ranges with
+                    about 95% of particles inside them.
+                'radial': Speed uniform within the `speed` range, directed away from the center of a
+                    circle spawn, or in a uniformly random direction for the other shapes.
+            vx (tuple): (min, max) horizontal velocity.
+            vy (tuple): (min, max) vertical velocity.
+            speed (tuple): (min, max) speed for radial velocities.
+            lifetime (tuple): (min, max) lifetime in frames. Defaults to `particle_lifetime`.
+            color_ramp (list): RGB colors the particles pass through over their life, evenly spaced
+                from birth to death. Defaults to `color`.
+        """
+        if shape not in SPAWN_SHAPES:
+            raise ValueError(f"Unknown spawn shape '{shape}'. Valid options: {list(SPAWN_SHAPES)}")
+        if velocity not in VELOCITY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown velocity distribution '{velocity}'. Valid options: {list(VELOCITY_DISTRIBUTIONS)}")
+        n = min(n, self.max_particles)
+        if n <= 0:
+            return
+
+        batch = np.empty((n, _COLUMNS))
+        rng = self.random
+
+        # Spawn positions
+        directions = None
+        if shape == 'point':
+            batch[:, _X] = x
+            batch[:, _Y] = y
+        elif shape == 'line':
+            offsets = rng.uniform(-extent, extent, n)
+            theta = np.radians(angle)
+            batch[:, _X] = x + offsets * np.cos(theta)
+            batch[:, _Y] = y + offsets * np.sin(theta)
+        else:
+            directions = rng.uniform(0, 2 * np.pi, n)
+            radii = extent * np.sqrt(rng.random(n))
+            batch[:, _X] = x + radii * np.cos(directions)
+            batch[:, _Y] = y + radii * np.sin(directions)
+
+        # Velocities
+        if velocity == 'uniform':
+            batch[:, _VX] = rng.uniform(*vx, n)
+            batch[:, _VY] = rng.uniform(*vy, n)
+        elif velocity == 'normal':
+            batch[:, _VX] = rng.normal((vx[0] + vx[1]) / 2, (vx[1] - vx[0]) / 4, n)
+            batch[:, _VY] = rng.normal((vy[0] + vy[1]) / 2, (vy[1] - vy[0]) / 4, n)
+        else:
+            if directions is None:
+                directions = rng.uniform(0, 2 * np.pi, n)
+            speeds = rng.uniform(*speed, n)
+            batch[:, _VX] = speeds * np.cos(directions)
+            batch[:, _VY] = speeds * np.sin(directions)
+
+        if lifetime is None:
+            batch[:, _LIFETIME] = self.particle_lifetime
+        else:
+            batch[:, _LIFETIME] = rng.integers(lifetime[0], lifetime[1], n, endpoint=True)
+        batch[:, _LIFE] = batch[:, _LIFETIME]
+        batch[:, _RAMP] = 0 if color_ramp is None else self._ramp_id(color_ramp)
+
+        # Keep the newest particles within the cap
+        self.particles = np.concatenate((self.particles, batch))[-self.max_particles:]
+
+    def _ramp_id(self, colors):
+        key = tuple(tuple(color) for color in colors)
+        if key not in self.ramp_ids:
+            colors = np.asarray(key, dtype=np.float32).reshape(-1, 3)
+            positions = np.linspace(0, 1, len(colors))
+            samples = np.linspace(0, 1, RAMP_STEPS)
+            ramp = np.stack([np.interp(samples, positions, colors[:, c]) for c in range(3)], axis=1)
+            self.ramps = np.concatenate((self.ramps, ramp[None].astype(np.float32)))
+            self.ramp_ids[key] = len(self.ramps) - 1
+        return self.ramp_ids[key]
+
+    def set_max_particles(self, max_particles):
+        """
+        Change the particle cap, discarding the oldest particles if there are now too many.
+
+        Args:
+            max_particles (int): Maximum number of particles to retain.
+        """
+        self.max_particles = max_particles
+        if len(self.particles) > max_particles:
+            self.particles = self.particles[len(self.particles) - max_particles:]
+
+    def memory_usage(self):
+        """
+        Report the memory held by live particles.
+
+        Returns:
+            list[tuple]: A single ('particles', bytes, None) entry; particles cannot be evicted.
+        """
+        return [('particles', self.particles.nbytes + self.ramps.nbytes, None)]
 
     def update(self):
         """
         Update particle positions and reduce their lifetime.
         """
-        for particle in self.particles:
-            particle["x"] += particle["vx"]
-            particle["y"] += particle["vy"]
-            particle["life"] -= 1
+        particles = self.particles
+        particles[:, _X] += particles[:, _VX]
+        particles[:, _Y] += particles[:, _VY]
+        particles[:, _LIFE] -= 1
+        alive = particles[:, _LIFE] > 0
+
+        # Remove particles that left the visible area for good; velocities are constant
+        area = self.bounds if self.bounds is not None else self.screen_clip
+        if area is not None:
+            area = area.inflate(2 * self.cull_margin, 2 * self.cull_margin)
+            x, y, vx, vy = particles[:, _X], particles[:, _Y], particles[:, _VX], particles[:, _VY]
+            alive &= ~(((x + PARTICLE_SIZE <= area.left) & (vx <= 0)) | ((x >= area.right) & (vx >= 0))
+                       | ((y + PARTICLE_SIZE <= area.top) & (vy <= 0)) | ((y >= area.bottom) & (vy >= 0)))
+
+        self.particles = particles[alive]
+
+    def get_bounds(self):
+        """
+        Get the screen area covered by the live particles.
+
+        Returns:
+            pygame.Rect: Bounding box in screen coordinates; empty if there are no particles.
+        """
+        if not len(self.particles):
+            return pygame.Rect(0, 0, 0, 0)
+        left, top = np.floor(self.particles[:, _X:_Y + 1].min(axis=0)).astype(int)
+        right, bottom = np.floor(self.particles[:, _X:_Y + 1].max(axis=0)).astype(int) + PARTICLE_SIZE
+        return pygame.Rect(left, top, right - left, bottom - top)
 
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p["life"] > 0]
+    def _visible(self, clip):
+        # Particles whose footprint overlaps the clip area
+        x, y = self.particles[:, _X], self.particles[:, _Y]
+        return self.particles[(x + PARTICLE_SIZE > clip.left) & (x < clip.right)
+                              & (y + PARTICLE_SIZE > clip.top) & (y < clip.bottom)]
+
+    def _colors(self, particles):
+        # Current color and fade (1 at birth, 0 at death) of every particle
+        self.ramps[0] = self.color
+        fade = particles[:, _LIFE] / particles[:, _LIFETIME]
+        steps = np.rint((1 - fade) * (RAMP_STEPS - 1)).astype(np.intp)
+        return self.ramps[particles[:, _RAMP].astype(np.intp), steps], fade
 
     def draw(self, screen):
         """
@@ -56,9 +236,65 @@ class ParticleTrail:
         Args:
             screen (pygame.Surface): Surface to draw the particles on.
         """
-        for particle in self.particles:
-            alpha = int(255 * (particle["life"] / self.particle_lifetime))  # Fade out effect
-            particle_color = (*self.color, alpha)
-            particle_surface = pygame.Surface((4, 4), pygame.SRCALPHA)  # Particle size: 4x4
-            pygame.draw.circle(particle_surface, particle_color, (2, 2), 2)
-            screen.blit(particle_surface, (particle["x"], particle["y"]))
+        clip = self.screen_clip = screen.get_clip()
+        particles = self._visible(clip)
+        if not len(particles):
+            return
+        if self.blend == 'alpha':
+            self._draw_alpha(screen, particles)
+        else:
+            self._draw_accumulated(screen, particles, clip)
+
+    def _draw_alpha(self, screen, particles):
+        colors, fade = self._colors(particles)
+        alphas = (255 * fade).astype(np.intp)  # Fade out effect
+        colors = colors.astype(np.intp)
+
+        if len(self.sprites) > 1024:
+            self.sprites.clear()
+        for (x, y), color, alpha in zip(particles[:, _X:_Y + 1].tolist(), colors.tolist(), alphas.tolist()):
+            particle_color = (*color, alpha)
+            sprite = self.sprites.get(particle_color)
+            if sprite is None:
+                sprite = self.sprites[particle_color] = pygame.Surface((PARTICLE_SIZE, PARTICLE_SIZE), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, particle_color, (PARTICLE_SIZE // 2, PARTICLE_SIZE // 2), PARTICLE_SIZE // 2)
+            screen.blit(sprite, (x, y))
+
+    def _draw_accumulated(self, screen, particles, clip):
+        if self.mask is None:
+            self.mask = _particle_mask()
+        colors, fade = self._colors(particles)
+        contributions = colors * fade[:, None]
+
+        # Splat every particle footprint into a float buffer covering just the visible particles' bounding box
+        xs = np.floor(particles[:, _X]).astype(np.intp)
+        ys = np.floor(particles[:, _Y]).astype(np.intp)
+        left, top = max(xs.min(), clip.left), max(ys.min(), clip.top)
+        right, bottom = min(xs.max() + PARTICLE_SIZE, clip.right), min(ys.max() + PARTICLE_SIZE, clip.bottom)
+        if left >= right or top >= bottom:
+            return
+        box_width, box_height = right - left, bottom - top
+
+        dx, dy = np.nonzero(self.mask)
+        px = xs[:, None] + dx - left
+        py = ys[:, None] + dy - top
+        inside = (px >= 0) & (px < box_width) & (py >= 0) & (py < box_height)
+        index = (px * box_height + py)[inside]
+        weighted = (contributions[:, None, :] * self.mask[dx, dy][None, :, None])[inside]
+
+        size = box_width * box_height
+        if self.blend == 'add':
+            buffer = np.stack([np.bincount(index, weighted[:, c], minlength=size) for c in range(3)], axis=1)
+        else:
+            buffer = np.zeros((size, 3))
+            np.maximum.at(buffer, index, weighted)
+        buffer = buffer.reshape(box_width, box_height, 3)
+
+        # Composite once
+        pixels = pygame.surfarray.pixels3d(screen)
+        region = pixels[left:right, top:bottom]
+        if self.blend == 'add':
+            region[...] = np.minimum(region + np.rint(buffer), 255)
+        else:
+            region[...] = np.maximum(region, np.rint(buffer))
+        del pixels
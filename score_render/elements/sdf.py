@@ -0,0 +1,213 @@
+import numpy as np
+import pygame
+
+from .text_cache import LRUCache
+
+# Pixels either side of the advance-based estimate searched for each glyph's rendered position,
+# covering kerning and the renderer's subpixel pen rounding
+_SNAP = 3
+
+# Upper bound on the temporary (rows, width, width) array used by the row pass of the distance transform
+_MAX_CHUNK_ELEMENTS = 1 << 22
+
+
+def distance_transform(mask):
+    """
+    Exact Euclidean distance from every pixel to the nearest True pixel of `mask`.
+
+    Separable algorithm: a forward/backward sweep along axis 1 gives the distance to the nearest
+    feature in the same column, then each row takes min over x' of (g[x']^2 + (x - x')^2),
+    evaluated in bounded chunks with broadcasting.
+
+    Args:
+        mask (np.ndarray): 2D boolean array of feature pixels.
+
+    Returns:
+        np.ndarray: float32 array of distances, same shape as `mask` (inf if `mask` has no True pixel).
+    """
+    width, height = mask.shape
+    inf = np.float32(width + height)
+    g = np.where(mask, 0, inf).astype(np.float32)
+
+    # 1D distances along axis 1
+    for y in range(1, height):
+        np.minimum(g[:, y], g[:, y - 1] + 1, out=g[:, y])
+    for y in range(height - 2, -1, -1):
+        np.minimum(g[:, y], g[:, y + 1] + 1, out=g[:, y])
+
+    # Combine along axis 0
+    g = np.square(g)
+    x = np.arange(width, dtype=np.float32)
+    dx2 = np.square(x[:, None] - x[None, :])  # (x, x')
+    out = np.empty_like(g)
+    chunk = max(1, _MAX_CHUNK_ELEMENTS // max(1, width * width))
+    for y0 in range(0, height, chunk):
+        g_chunk = g[:, y0:y0 + chunk].T  # (rows, x')
+        out[:, y0:y0 + chunk] = (g_chunk[:, None, :] + dx2[None, :, :]).min(axis=2).T
+    result = np.sqrt(out)
+    if not mask.any():
+        result[:] = np.inf
+    return result
+
+
+def signed_distance_field(alpha, threshold=128):
+    """
+    Signed distance field of an alpha mask: negative inside, positive outside, ~0 on the edge.
+
+    Args:
+        alpha (np.ndarray): 2D uint8 coverage array (e.g. from `pygame.surfarray.array_alpha`).
+        threshold (int): Alpha at or above which a pixel counts as inside.
+
+    Returns:
+        np.ndarray: float32 signed distances in pixels.
+    """
+    inside = alpha >= threshold
+    outside_distance = distance_transform(inside)
+    inside_distance = distance_transform(~inside)
+    return np.where(inside, 0.5 - inside_distance, outside_distance - 0.5).astype(np.float32)
+
+
+class SdfTextRenderer:
+    def __init__(self, max_entries=128, max_glyphs=512):
+        """
+        Render `TextShadow` stacks (outlines, drop shadows, glows) from a signed distance field.
+
+        The distance field of each glyph is computed once and cached per (font, character). A string's
+        field is the minimum of its glyph fields, each placed at the width of the text before it (as
+        `font.render` lays it out), so new strings (e.g. a
+        score counter ticking up) only composite cached fields. Every shadow layer is then a threshold
+        of that field at its thickness, shifted by its offset and softened by its softness. The cost is
+        independent of thickness, unlike blitting the text at every offset within a disc. All layers
+        are flattened into one surface, so drawing costs a single blit per frame.
+
+        Args:
+            max_entries (int): Number of composited shadow surfaces kept in the LRU cache.
+            max_glyphs (int): Number of glyph distance fields kept in the LRU cache.
+        """
+        self.cache = LRUCache(max_entries)
+        self.glyphs = LRUCache(max_glyphs)
+
+    def render_shadows(self, font, text, shadows):
+        """
+        Composite a stack of shadow layers for a string.
+
+        Args:
+            font (pygame.font.Font): Font used to render the text.
+            text (str): Text to render.
+            shadows (list[TextShadow]): Layers, drawn in order (later layers on top).
+
+        Returns:
+            tuple: (pygame.Surface, (dx, dy)) where the surface holds every layer and (dx, dy) is the
+            position of the text's top-left corner within it. Returns (None, (0, 0)) if there is
+            nothing to draw. Surfaces are shared and must not be drawn on.
+        """
+        key = (font, text, tuple((tuple(s.color), s.thickness, tuple(s.offset), s.softness) for s in shadows))
+        return self.cache.get(key, lambda: self._render(font, text, shadows))
+
+    def _render(self, font, text, shadows):
+        if not shadows or not text:
+            return None, (0, 0)
+
+        # Pad enough for the widest layer, including its offset and soft falloff
+        pad = max(
+            int(np.ceil(s.thickness + s.softness)) + 1 + max(abs(s.offset[0]), abs(s.offset[1]))
+            for s in shadows
+        )
+        sdf = self.text_field(font, text, pad)
+
+        width, height = sdf.shape
+        rgb = np.zeros((width, height, 3), dtype=np.float32)
+        out_alpha = np.zeros((width, height), dtype=np.float32)
+        for shadow in shadows:
+            coverage = np.clip((shadow.thickness - sdf) / (shadow.softness + 1) + 0.5, 0, 1)
+            coverage = self._shift(coverage, shadow.offset)
+            # Porter-Duff "over" with straight (non-premultiplied) colors
+            new_alpha = coverage + out_alpha * (1 - coverage)
+            weight = np.divide(coverage, new_alpha, out=np.zeros_like(coverage), where=new_alpha > 0)
+            rgb += (np.asarray(shadow.color, dtype=np.float32)[None, None, :] - rgb) * weight[:, :, None]
+            out_alpha = new_alpha
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.surfarray.blit_array(surface, rgb.astype(np.uint8))
+        pygame.surfarray.pixels_alpha(surface)[:] = (out_alpha * 255 + 0.5).astype(np.uint8)
+        return surface, (pad, pad)
+
+    def glyph(self, font, char, pad):
+        """
+        Get the (cached) coverage and signed distance field of a single glyph.
+
+        Args:
+            font (pygame.font.Font): Font used to render the glyph.
+            char (str): A single character.
+            pad (int): Border in pixels around the glyph's rendered surface.
+
+        Returns:
+            tuple: (alpha, field). alpha is the int16 coverage of the glyph's rendered surface; field is
+            the float32 signed distance field of shape (glyph width + 2 * pad, glyph height + 2 * pad),
+            or None for glyphs without any ink (e.g. spaces).
+        """
+        def build():
+            alpha = pygame.surfarray.array_alpha(font.render(char, True, (255, 255, 255)))
+            if not alpha.any():
+                return alpha.astype(np.int16), None
+            padded = np.zeros((alpha.shape[0] + 2 * pad, alpha.shape[1] + 2 * pad), dtype=np.uint8)
+            padded[pad:pad + alpha.shape[0], pad:pad + alpha.shape[1]] = alpha
+            return alpha.astype(np.int16), signed_distance_field(padded)
+
+        return self.glyphs.get((font, char, pad), build)
+
+    def text_field(self, font, text, pad):
+        """
+        Build the signed distance field of a string from its cached glyph fields.
+
+        Glyphs are placed where `font.render` draws them. The integer advances from `font.metrics`
+        ignore kerning and the renderer's subpixel pen positions, so each glyph is snapped to where it
+        best matches the rendered string, within a few pixels of its advance-based position.
+
+        Args:
+            font (pygame.font.Font): Font used to render the text.
+            text (str): Text to render.
+            pad (int): Border in pixels around the rendered text.
+
+        Returns:
+            np.ndarray: float32 field of shape (text width + 2 * pad, text height + 2 * pad). Distances
+            beyond `pad` are clamped to just over `pad`.
+        """
+        line = pygame.surfarray.array_alpha(font.render(text, True, (255, 255, 255))).astype(np.int16)
+        text_width, text_height = line.shape
+        metrics = font.metrics(text)
+        # A glyph reaching left of its origin (negative minx) sits that much further right in its own
+        # surface; `font.render` shifts the whole line right by the first glyph's overhang
+        pen = -min(0, metrics[0][0]) if metrics[0] is not None else 0
+        margin = max(font.size(char)[0] for char in set(text)) + _SNAP + 1
+        line = np.pad(line, ((margin, margin), (0, 0)))
+
+        placed = []
+        for char, metric in zip(text, metrics):
+            if metric is None:
+                pen += font.size(char)[0]
+                continue
+            alpha, field = self.glyph(font, char, pad)
+            x = pen + min(0, metric[0])
+            if field is not None:
+                width, height = alpha.shape
+                x = min((x for x in range(x - _SNAP, x + _SNAP + 1) if x >= 0), key=lambda x: np.abs(
+                    line[margin + x:margin + x + width, :height] - alpha).sum())
+                placed.append((x, field))
+            pen = x - min(0, metric[0]) + metric[4]
+
+        width = max([text_width] + [x + field.shape[0] - 2 * pad for x, field in placed])
+        sdf = np.full((width + 2 * pad, text_height + 2 * pad), pad + 1, dtype=np.float32)
+        for x, field in placed:
+            region = sdf[x:x + field.shape[0], :field.shape[1]]
+            np.minimum(region, field, out=region)
+        return sdf
+
+    @staticmethod
+    def _shift(array, offset):
+        dx, dy = offset
+        shifted = np.zeros_like(array)
+        width, height = array.shape
+        shifted[max(dx, 0):width + min(dx, 0), max(dy, 0):height + min(dy, 0)] = \
+            array[max(-dx, 0):width - max(dx, 0), max(-dy, 0):height - max(dy, 0)]
+        return shifted
@@ -1,7 +1,14 @@
+import math
+
 import pygame
 
+from .footprint import surface_bytes
+
+SHADOW_MODES = ('blit', 'sdf')
+
+
 class TextShadow:
-    def __init__(self, color, thickness=5, offset=(0, 0)):
+    def __init__(self, color, thickness=5, offset=(0, 0), softness=0):
         """
         Text shadow parameters
 
@@ -9,43 +16,82 @@ class TextShadow:
             shadow_color (tuple): RGB color for the drop shadow. If None, no shadow is drawn.
             shadow_thickness (int): Thickness of the shadow in pixels.
             shadow_offset (tuple): Offset of the shadow in pixels, positive shifts right/down
+            softness (float): Width in pixels of the soft falloff at the shadow edge, for glows. Only used
+                by the 'sdf' shadow mode.
         """
         self.color = color
         self.thickness = thickness
         self.offset = offset
+        self.softness = softness
+
+        # Integer offsets within a disc of radius `thickness`, shifted by `offset`
+        self.offsets = [
+            (offset_x + offset[0], offset_y + offset[1])
+            for offset_x in range(-thickness, thickness + 1)
+            for offset_y in range(-thickness, thickness + 1)
+            if offset_x ** 2 + offset_y ** 2 <= thickness ** 2  # Circular shadow area
+        ]
+
+        # (left, top, right, bottom) reach of the shadow beyond the text rect, including the soft edge
+        pad = math.ceil(softness) + 1 if softness else 0
+        self.extent = (
+            min(0, min(dx for dx, _ in self.offsets) - pad),
+            min(0, min(dy for _, dy in self.offsets) - pad),
+            max(0, max(dx for dx, _ in self.offsets) + pad),
+            max(0, max(dy for _, dy in self.offsets) + pad),
+        )
 
 
 class TextBox:
-    def __init__(self, text, font=None, font_size=36, color=(0, 0, 0), bg_color=None, anchor="topleft", padding=10, shadow=None):
+    def __init__(self, text, font=None, font_size=36, color=(0, 0, 0), bg_color=None, anchor="topleft", padding=10, shadow=None, cache=None,
+                 shadow_mode="blit", sdf_renderer=None):
         """
         Initialize a TextBox object with anchor-based positioning.
 
         Args:
             text (str): Initial text to display in the text box.
-            font (str): Path to the font file. If None, the default font is used.
+            font (str, pygame.font.Font): Path to the font file, or an already loaded font to share. If None,
+                the default font is used.
             font_size (int): Size of the font.
             color (tuple): RGB color for the text.
             bg_color (tuple): RGB color for the background of the text box. If None, no background is drawn.
             anchor (str): Anchor point for positioning (e.g., 'topleft', 'center', 'topright', etc.).
             padding (int): Padding around the text inside the text box.
             shadow (TextShadow, list[TextShadow]): TextShadow objects defining the shadow of the text box.
+            cache (TextLayoutCache): Optional shared cache for rendered surfaces.
+            shadow_mode (str): How shadows are drawn. 'blit' stamps the text at every offset within the
+                shadow's disc (cost grows with thickness squared); 'sdf' thresholds a signed distance field
+                of the text, so any thickness or softness costs the same.
+            sdf_renderer (SdfTextRenderer): Renderer shared between text boxes in 'sdf' mode. Created if None.
         """
+        if shadow_mode not in SHADOW_MODES:
+            raise ValueError(f"Unknown shadow mode '{shadow_mode}'. Valid options: {list(SHADOW_MODES)}")
+
         self.text = text
         self.color = color
         self.bg_color = bg_color
         self.padding = padding
         self.anchor = anchor
+        self.cache = cache
+        self.pinned = []  # Keys of the shared cache surfaces held by this text box
+        self.max_shadow_layers = None  # Limit on drawn shadow layers (innermost kept), set by QualityGovernor
+        self.shadow_mode = shadow_mode
+        if shadow_mode == 'sdf':
+            if sdf_renderer is None:
+                from .sdf import SdfTextRenderer  # NumPy is only needed in 'sdf' mode
+                sdf_renderer = SdfTextRenderer()
+            self.sdf_renderer = sdf_renderer
 
         if shadow is not None:
             self.shadows = shadow if isinstance(shadow, (tuple, list)) else [shadow]
         else:
             self.shadows = []
 
-        # Load font
-        self.font = pygame.font.Font(font, font_size)
+        # Load font, unless a shared one was given
+        self.font = font if isinstance(font, pygame.font.Font) else pygame.font.Font(font, font_size)
 
         # Render text and set initial rectangle
-        self.text_surface = self.font.render(self.text, True, self.color)
+        self.render_text()
         self.rect = self.text_surface.get_rect()
 
         # Store the initial position (will be updated with `set_position`)
@@ -58,12 +104,62 @@ class TextBox:
         Args:
             text (str): New text to display.
         """
+        if text == self.text:
+            return  # Nothing to re-rasterize or re-layout
+
         self.text = text
-        self.text_surface = self.font.render(self.text, True, self.color)
+        self.render_text()
         previous_anchor_position = getattr(self.rect, self.anchor)  # Get the current anchor position
         self.rect = self.text_surface.get_rect()  # Update the rect with new text size
         setattr(self.rect, self.anchor, previous_anchor_position)  # Reapply the anchor position
 
+    def render_text(self):
+        """
+        Rasterize the current text and, in 'blit' shadow mode, one copy per distinct shadow color.
+        """
+        if self.cache is not None:
+            render = self.cache.render
+        else:
+            render = lambda font, text, color: font.render(text, True, color)
+        # Layers often share a color (e.g. black outline and drop shadow), so each color is rendered once
+        colors = [self.color] + ([shadow.color for shadow in self.shadows] if self.shadow_mode == 'blit' else [])
+        surfaces = {color: render(self.font, self.text, color) for color in dict.fromkeys(map(tuple, colors))}
+        self.text_surface = surfaces[tuple(self.color)]
+        if self.shadow_mode == 'blit':
+            self.shadow_surfaces = [surfaces[tuple(shadow.color)] for shadow in self.shadows]
+
+        if self.cache is not None:
+            # Pin the shared surfaces held here, so memory eviction skips them (dropping them would free nothing)
+            pinned = [self.cache.surface_key(self.font, self.text, color) for color in surfaces]
+            for key in pinned:
+                self.cache.surfaces.pin(key)
+            self.release()
+            self.pinned = pinned
+
+    def release(self):
+        """
+        Unpin the shared cache surfaces held by this text box. Call when discarding a text box that
+        uses a shared `cache`.
+        """
+        for key in self.pinned:
+            self.cache.surfaces.unpin(key)
+        self.pinned = []
+
+    def memory_usage(self):
+        """
+        Report the memory held by this text box's own rendered surfaces.
+
+        Surfaces coming from a shared `cache` are reported by the cache instead.
+
+        Returns:
+            list[tuple]: (key, bytes, last_used) per surface. last_used is None as they cannot be evicted.
+        """
+        if self.cache is not None:
+            return []
+        surfaces = [self.text_surface] + (self.shadow_surfaces if self.shadow_mode == 'blit' else [])
+        surfaces = list({id(surface): surface for surface in surfaces}.values())  # Layers of one color share a surface
+        return [(i, surface_bytes(surface), None) for i, surface in enumerate(surfaces)]
+
     def set_position(self, x, y):
         """
         Set the position of the text box based on its anchor.
@@ -75,6 +171,34 @@ class TextBox:
         self.position = (x, y)
         setattr(self.rect, self.anchor, self.position)
 
+    def first_shadow_layer(self):
+        """
+        Get the index of the outermost shadow layer that is drawn under `max_shadow_layers`.
+
+        Returns:
+            int: Index into `shadows`.
+        """
+        if self.max_shadow_layers is None:
+            return 0
+        # Drop the outermost layers first; the last shadow is drawn closest to the text
+        return max(0, len(self.shadows) - self.max_shadow_layers)
+
+    def get_bounds(self):
+        """
+        Get the screen area touched by `draw`: the text, its drawn shadow layers and its background.
+
+        Returns:
+            pygame.Rect: Bounding box in screen coordinates.
+        """
+        bounds = self.rect.copy()
+        if self.bg_color:
+            bounds.union_ip(self.rect.inflate(self.padding * 2, self.padding * 2))
+        for shadow in self.shadows[self.first_shadow_layer():]:
+            left, top, right, bottom = shadow.extent
+            bounds.union_ip(pygame.Rect(self.rect.left + left, self.rect.top + top,
+                                        self.rect.width + right - left, self.rect.height + bottom - top))
+        return bounds
+
     def draw(self, screen):
         """
         Draw the text box on the screen.
@@ -88,13 +212,15 @@ class TextBox:
             pygame.draw.rect(screen, self.bg_color, bg_rect)
 
         # Draw thick drop shadow if enabled
-        for shadow in self.shadows:
-            for offset_x in range(-shadow.thickness, shadow.thickness + 1):
-                for offset_y in range(-shadow.thickness, shadow.thickness + 1):
-                    if offset_x ** 2 + offset_y ** 2 <= shadow.thickness ** 2:  # Circular shadow area
-                        shadow_rect = self.rect.move(offset_x + shadow.offset[0], offset_y + shadow.offset[1])
-                        shadow_surface = self.font.render(self.text, True, shadow.color)
-                        screen.blit(shadow_surface, shadow_rect)
+        first_layer = self.first_shadow_layer()
+
+        if self.shadow_mode == 'sdf':
+            shadow_surface, (dx, dy) = self.sdf_renderer.render_shadows(self.font, self.text, self.shadows[first_layer:])
+            if shadow_surface is not None:
+                screen.blit(shadow_surface, self.rect.move(-dx, -dy))
+        else:
+            for shadow, shadow_surface in zip(self.shadows[first_layer:], self.shadow_surfaces[first_layer:]):
+                screen.blits([(shadow_surface, self.rect.move(offset)) for offset in shadow.offsets], doreturn=False)
 
         # Draw the main text
         screen.blit(self.text_surface, self.rect)
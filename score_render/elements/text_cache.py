@@ -0,0 +1,204 @@
+import time
+from collections import OrderedDict
+
+
+from .footprint import value_bytes
+
+
+class LRUCache:
+    def __init__(self, max_entries=256):
+        """
+        Bounded least-recently-used mapping with hit/miss accounting.
+
+        Args:
+            max_entries (int): Maximum number of entries kept before the oldest is evicted.
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.last_used = {}
+        self.pins = {}  # key -> number of holders that still reference the value
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, factory):
+        """
+        Get the cached value for `key`, computing it with `factory()` on a miss.
+
+        Args:
+            key (hashable): Cache key.
+            factory (callable): Zero-argument callable producing the value.
+
+        Returns:
+            The cached or newly computed value.
+        """
+        self.last_used[key] = time.monotonic()
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            value = self.entries[key] = factory()
+            if len(self.entries) > self.max_entries:
+                oldest, _ = self.entries.popitem(last=False)
+                del self.last_used[oldest]
+            return value
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def pin(self, key):
+        """
+        Mark an entry as in use elsewhere. Pinned entries are reported as not evictable, since
+        dropping them from the cache would not release their memory.
+
+        Args:
+            key (hashable): Cache key.
+        """
+        self.pins[key] = self.pins.get(key, 0) + 1
+
+    def unpin(self, key):
+        """
+        Release a pin taken with `pin`.
+
+        Args:
+            key (hashable): Cache key.
+        """
+        count = self.pins.get(key, 0) - 1
+        if count > 0:
+            self.pins[key] = count
+        else:
+            self.pins.pop(key, None)
+
+    @property
+    def hit_rate(self):
+        """float: Fraction of lookups served from the cache (0 if there were none)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """Drop all entries. Hit/miss counters are kept."""
+        self.entries.clear()
+        self.last_used.clear()
+
+    def memory_usage(self):
+        """
+        Report the memory held by the cached values.
+
+        Returns:
+            list[tuple]: (key, bytes, last_used) per entry. last_used is None for pinned entries.
+        """
+        return [(key, value_bytes(value), None if key in self.pins else self.last_used[key])
+                for key, value in self.entries.items()]
+
+    def evict(self, key):
+        """
+        Drop a single entry. Pinned entries are kept.
+
+        Args:
+            key (hashable): Cache key, as reported by `memory_usage`.
+
+        Returns:
+            int: Bytes released.
+        """
+        if key not in self.entries or key in self.pins:
+            return 0
+        del self.last_used[key]
+        return value_bytes(self.entries.pop(key))
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class TextLayoutCache:
+    def __init__(self, max_strings=1024, max_surfaces=64):
+        """
+        Shared memoization layer between score values and the text rasterizer.
+
+        Caches formatted score strings and rendered text surfaces, each in its own bounded LRU.
+        Formatting runs every frame on tweened values, which repeat as soon as a counter settles, so
+        most frames are served without formatting anything. `TextBox.set_text` already ignores
+        unchanged text, so only changed strings reach the surface cache: it serves strings that come
+        back (a reset to '0.00%' or '+0', text boxes sharing a font and color, elements rebuilt on a
+        layout reload) rather than every frame. Text rects are taken from the rendered surfaces, so
+        no separate `font.size` layer is kept.
+
+        Args:
+            max_strings (int): Capacity of the formatted string cache.
+            max_surfaces (int): Capacity of the rendered surface cache. A text box with 'blit' shadows
+                needs one surface per distinct color (typically 3 per string), so the default covers
+                the current and a few recent strings of a handful of text boxes without keeping
+                every counter value ever shown.
+        """
+        self.strings = LRUCache(max_strings)
+        self.surfaces = LRUCache(max_surfaces)
+
+    def format_percent(self, percent):
+        """
+        Format a percentage with two decimals, e.g. '98.76%'.
+
+        The value is rounded to two decimals before lookup so that tweened values which display
+        identically share a cache entry. `round` and the '.2f' format use the same correctly rounded
+        conversion, so the text always matches `f"{percent:.2f}%"`.
+
+        Args:
+            percent (float): Percentage in [0, 100].
+
+        Returns:
+            str: The formatted string.
+        """
+        return self.strings.get(('percent', round(percent, 2)), lambda: f"{percent:.2f}%")
+
+    def format_lead(self, diff):
+        """
+        Format a score lead, e.g. '+1234'.
+
+        Args:
+            diff (int): Non-negative score difference.
+
+        Returns:
+            str: The formatted string.
+        """
+        diff = round(diff)
+        return self.strings.get(('lead', diff), lambda: f"+{diff}")
+
+    def render(self, font, text, color):
+        """
+        Render antialiased text, reusing a previously rendered surface when possible.
+
+        Returned surfaces are shared and must not be drawn on.
+
+        Args:
+            font (pygame.font.Font): Font used to render.
+            text (str): Text to render.
+            color (tuple): RGB text color.
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        return self.surfaces.get(self.surface_key(font, text, color), lambda: font.render(text, True, color))
+
+    @staticmethod
+    def surface_key(font, text, color):
+        """
+        Get the key `render` caches a surface under, e.g. to pin it in `surfaces`.
+
+        Args:
+            font (pygame.font.Font): Font used to render.
+            text (str): Text to render.
+            color (tuple): RGB text color.
+
+        Returns:
+            tuple: The cache key.
+        """
+        return font, text, tuple(color)
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Per-cache entry counts, hits, misses and hit rates.
+        """
+        return {
+            name: dict(entries=len(cache), hits=cache.hits, misses=cache.misses, hit_rate=cache.hit_rate)
+            for name, cache in (('strings', self.strings), ('surfaces', self.surfaces))
+        }
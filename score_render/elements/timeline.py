@@ -0,0 +1,411 @@
+from collections import defaultdict
+
+import numpy as np
+
+
+def _linear(p):
+    return p
+
+
+def _ease_in_quad(p):
+    return p * p
+
+
+def _ease_out_quad(p):
+    return p * (2 - p)
+
+
+def _ease_in_out_quad(p):
+    return np.where(p < 0.5, 2 * p * p, -1 + (4 - 2 * p) * p)
+
+
+def _ease_out_cubic(p):
+    return 1 - (1 - p) ** 3
+
+
+def _ease_in_out_cubic(p):
+    return np.where(p < 0.5, 4 * p ** 3, 1 - (-2 * p + 2) ** 3 / 2)
+
+
+def _ease_out_back(p):
+    c1 = 1.70158
+    c3 = c1 + 1
+    return 1 + c3 * (p - 1) ** 3 + c1 * (p - 1) ** 2
+
+
+# Easing curves map normalized progress in [0, 1] to eased progress. All operate on whole arrays.
+EASINGS = {
+    'linear': _linear,
+    'ease_in_quad': _ease_in_quad,
+    'ease_out_quad': _ease_out_quad,
+    'ease_in_out_quad': _ease_in_out_quad,
+    'ease_out_cubic': _ease_out_cubic,
+    'ease_in_out_cubic': _ease_in_out_cubic,
+    'ease_out_back': _ease_out_back,
+}
+_EASING_IDS = {name: i for i, name in enumerate(EASINGS)}
+_EASING_FUNCS = list(EASINGS.values())
+
+
+class Timeline:
+    def __init__(self, capacity=64):
+        """
+        Container evaluating every active tween in a single vectorized pass per frame.
+
+        Tweens live in flat NumPy arrays (structure of arrays) and are referred to by integer
+        handles, so hundreds of concurrent tweens cost a handful of array operations per frame
+        rather than one Python call each.
+
+        Args:
+            capacity (int): Initial number of tween slots. Grows automatically.
+        """
+        self.time = 0.0
+        self._start = np.zeros(capacity)
+        self._end = np.zeros(capacity)
+        self._t0 = np.zeros(capacity)
+        self._duration = np.ones(capacity)
+        self._easing = np.zeros(capacity, dtype=np.int16)
+        self._active = np.zeros(capacity, dtype=bool)
+        self._values = np.zeros(capacity)
+        self._free = list(range(capacity - 1, -1, -1))
+        self._on_complete = {}
+
+    def _grow(self):
+        capacity = len(self._values)
+        for name in ('_start', '_end', '_t0', '_duration', '_easing', '_active', '_values'):
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+        self._duration[capacity:] = 1
+        self._free.extend(range(2 * capacity - 1, capacity - 1, -1))
+
+    @staticmethod
+    def _easing_id(easing):
+        if easing not in _EASING_IDS:
+            raise ValueError(f"Unknown easing '{easing}'. Valid options: {list(EASINGS)}")
+        return _EASING_IDS[easing]
+
+    def tween(self, start, end, duration, easing='ease_out_cubic', delay=0.0, on_complete=None):
+        """
+        Start a new tween.
+
+        Args:
+            start (float): Initial value.
+            end (float): Final value.
+            duration (float): Duration of the tween in seconds.
+            easing (str): Name of the easing curve (see `EASINGS`).
+            delay (float): Seconds to wait before the tween starts moving.
+            on_complete (callable): Called with the handle once the tween reaches its end value.
+
+        Returns:
+            int: Handle used to query, retarget or release the tween.
+        """
+        if not self._free:
+            self._grow()
+        handle = self._free.pop()
+        self._start[handle] = start
+        self._end[handle] = end
+        self._t0[handle] = self.time + delay
+        self._duration[handle] = max(duration, 1e-9)
+        self._easing[handle] = self._easing_id(easing)
+        self._values[handle] = start
+        self._active[handle] = True
+        if on_complete is not None:
+            self._on_complete[handle] = on_complete
+        return handle
+
+    def retarget(self, handle, end, duration=None, easing=None):
+        """
+        Redirect a tween towards a new end value, continuing smoothly from its current value.
+
+        Args:
+            handle (int): Tween handle.
+            end (float): New final value.
+            duration (float): New duration in seconds. If None, the previous duration is reused.
+            easing (str): New easing curve. If None, the previous curve is reused.
+        """
+        self._start[handle] = self._values[handle]
+        self._end[handle] = end
+        self._t0[handle] = self.time
+        if duration is not None:
+            self._duration[handle] = max(duration, 1e-9)
+        if easing is not None:
+            self._easing[handle] = self._easing_id(easing)
+        self._active[handle] = True
+
+    def set(self, handle, value):
+        """
+        Jump a tween immediately to a value and stop it.
+
+        Args:
+            handle (int): Tween handle.
+            value (float): New value.
+        """
+        self._start[handle] = self._end[handle] = self._values[handle] = value
+        self._active[handle] = False
+
+    def copy(self, source, destination):
+        """
+        Copy the full state of one tween onto another, so the destination continues exactly where the
+        source is (mid-flight included). Completion callbacks are not copied.
+
+        Args:
+            source (int): Handle of the tween to copy.
+            destination (int): Handle of the tween to overwrite.
+        """
+        for name in ('_start', '_end', '_t0', '_duration', '_easing', '_active', '_values'):
+            array = getattr(self, name)
+            array[destination] = array[source]
+
+    def value(self, handle):
+        """
+        Get the current value of a tween.
+
+        Args:
+            handle (int): Tween handle.
+
+        Returns:
+            float: The value as of the last `update`.
+        """
+        return float(self._values[handle])
+
+    def is_active(self, handle):
+        """bool: Whether the tween is still moving towards its end value."""
+        return bool(self._active[handle])
+
+    def release(self, handle):
+        """
+        Free a tween slot for reuse. The handle must not be used afterwards.
+
+        Args:
+            handle (int): Tween handle.
+        """
+        self._active[handle] = False
+        self._on_complete.pop(handle, None)
+        self._free.append(handle)
+
+    def update(self, dt):
+        """
+        Advance the timeline and evaluate all active tweens.
+
+        Args:
+            dt (float): Time elapsed since the last update (in seconds).
+        """
+        self.time += dt
+        active = np.flatnonzero(self._active)
+        if not active.size:
+            return
+
+        progress = np.clip((self.time - self._t0[active]) / self._duration[active], 0, 1)
+        easing = self._easing[active]
+        eased = np.empty_like(progress)
+        for easing_id in np.unique(easing):
+            mask = easing == easing_id
+            eased[mask] = _EASING_FUNCS[easing_id](progress[mask])
+
+        start = self._start[active]
+        self._values[active] = start + (self._end[active] - start) * eased
+
+        done = active[progress >= 1]
+        if done.size:
+            self._values[done] = self._end[done]
+            self._active[done] = False
+            for handle in done.tolist():
+                callback = self._on_complete.pop(handle, None)
+                if callback is not None:
+                    callback(handle)
+
+
+class TweenedValue:
+    def __init__(self, timeline, value=0.0, duration=0.5, easing='ease_out_cubic'):
+        """
+        A single value that glides towards whatever target it is given, e.g. a score counter.
+
+        Args:
+            timeline (Timeline): Timeline evaluating the underlying tween.
+            value (float): Initial value.
+            duration (float): Seconds taken to reach each new target.
+            easing (str): Name of the easing curve (see `EASINGS`).
+        """
+        self.timeline = timeline
+        self.duration = duration
+        self.easing = easing
+        self.target = value
+        self.handle = timeline.tween(value, value, duration, easing)
+        timeline.set(self.handle, value)
+
+    @property
+    def value(self):
+        """float: The current (interpolated) value."""
+        return self.timeline.value(self.handle)
+
+    def set(self, target):
+        """
+        Start moving towards a new target. Does nothing if the target is unchanged.
+
+        Args:
+            target (float): The new target value.
+        """
+        if target == self.target:
+            return
+        self.target = target
+        self.timeline.retarget(self.handle, target, self.duration, self.easing)
+
+    def clone(self, duration=None):
+        """
+        Create an independent copy that continues exactly where this value is, mid-tween included.
+
+        Args:
+            duration (float): Seconds taken by the copy to reach later targets. Defaults to this value's.
+
+        Returns:
+            TweenedValue: The copy, on the same timeline.
+        """
+        copy = TweenedValue(self.timeline, self.value, self.duration if duration is None else duration, self.easing)
+        copy.target = self.target
+        self.timeline.copy(self.handle, copy.handle)
+        return copy
+
+    def snap(self, value):
+        """
+        Jump to a value immediately, without animating.
+
+        Args:
+            value (float): The new value.
+        """
+        self.target = value
+        self.timeline.set(self.handle, value)
+
+
+class ScoreEvent:
+    def __init__(self, name, previous, current, player=None):
+        """
+        A discrete score event detected between two consecutive snapshots.
+
+        Args:
+            name (str): Event name (e.g. 'lead_changed').
+            previous (ScoreSnapshot): Snapshot before the event. May be None.
+            current (ScoreSnapshot): Snapshot that triggered the event.
+            player (int): Player the event concerns (1 or 2), if any.
+        """
+        self.name = name
+        self.previous = previous
+        self.current = current
+        self.player = player
+
+    def __repr__(self):
+        return f"ScoreEvent({self.name!r}, player={self.player!r})"
+
+
+class _LeadTracker:
+    """Remembers the last leader so that P1 -> tie -> P2 still counts as a lead change."""
+
+    def __init__(self):
+        self.leader = None
+
+    def __call__(self, previous, current):
+        if not current.playing:
+            self.leader = None
+            return
+        diff = current.diff
+        if not diff:
+            return
+        leader = 1 if diff > 0 else 2
+        if self.leader is not None and leader != self.leader:
+            yield {'player': leader}
+        self.leader = leader
+
+
+def _song_started(previous, current):
+    if current.playing and (previous is None or not previous.playing):
+        yield {}
+
+
+def _song_ended(previous, current):
+    if previous is not None and previous.playing and not current.playing:
+        yield {}
+
+
+def _score_changed(previous, current):
+    for player in (1, 2):
+        attr = f'p{player}_score'
+        if getattr(current, attr) is not None and (previous is None or getattr(previous, attr) != getattr(current, attr)):
+            yield {'player': player}
+
+
+def _full_combo_lost(previous, current):
+    if previous is None:
+        return
+    for player in (1, 2):
+        attr = f'p{player}_full_combo'
+        if getattr(previous, attr) and getattr(current, attr) is False:
+            yield {'player': player}
+
+
+class ScoreEvents:
+    def __init__(self):
+        """
+        Detect discrete events ('lead_changed', 'full_combo_lost', ...) from a stream of snapshots
+        and dispatch them to registered callbacks.
+
+        Built-in events:
+            song_started, song_ended: State transitions into/out of 'song_playing'.
+            score_changed: A player's score changed (player is set).
+            lead_changed: The leading player changed, ignoring ties in between (player is the new leader).
+            full_combo_lost: A player's full combo flag went from True to False (player is set).
+        """
+        self.previous = None
+        self.detectors = {
+            'song_started': _song_started,
+            'song_ended': _song_ended,
+            'score_changed': _score_changed,
+            'lead_changed': _LeadTracker(),
+            'full_combo_lost': _full_combo_lost,
+        }
+        self.handlers = defaultdict(list)
+
+    def add_event(self, name, detector):
+        """
+        Register a custom event.
+
+        Args:
+            name (str): Event name.
+            detector (callable): Generator `detector(previous, current)` yielding one dict of
+                `ScoreEvent` keyword arguments (e.g. `{'player': 1}`) per event occurrence.
+        """
+        self.detectors[name] = detector
+
+    def on(self, name, callback):
+        """
+        Subscribe to an event.
+
+        Args:
+            name (str): Event name.
+            callback (callable): Called with a `ScoreEvent` each time the event fires.
+        """
+        if name not in self.detectors:
+            raise ValueError(f"Unknown event '{name}'. Valid options: {list(self.detectors)}")
+        self.handlers[name].append(callback)
+
+    def update(self, snapshot):
+        """
+        Feed the latest snapshot. Passing the same snapshot object again is a no-op, so this can be
+        called every frame.
+
+        Args:
+            snapshot (ScoreSnapshot): The latest snapshot. None is ignored.
+
+        Returns:
+            list[ScoreEvent]: Events fired by this snapshot.
+        """
+        if snapshot is None or snapshot is self.previous:
+            return []
+
+        fired = []
+        for name, detector in self.detectors.items():
+            for info in detector(self.previous, snapshot) or ():
+                event = ScoreEvent(name, self.previous, snapshot, **info)
+                fired.append(event)
+                for callback in self.handlers[name]:
+                    callback(event)
+        self.previous = snapshot
+        return fired
@@ -1,3 +1,12 @@
-from .websocket import WebSocketClient, WebSocketHandler
+from score_render._lazy import lazy_exports
 
-__all__ = ['WebSocketClient', 'WebSocketHandler']
+# The WebSocket client pulls in websockets and asyncio; snapshots alone need neither
+_EXPORTS = {
+    'WebSocketClient': '.websocket',
+    'WebSocketHandler': '.websocket',
+    'ScoreSnapshot': '.snapshot',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
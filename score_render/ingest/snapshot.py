@@ -0,0 +1,114 @@
+import json
+from datetime import datetime
+
+DEFAULT_MAX_SCORE = 1000000
+
+
+class ScoreSnapshot:
+    __slots__ = ('state', 'p1_score', 'p2_score', 'p1_max_score', 'p2_max_score', 'p1_full_combo', 'p2_full_combo', 'time')
+
+    def __init__(self, state=None, p1_score=None, p2_score=None,
+                 p1_max_score=DEFAULT_MAX_SCORE, p2_max_score=DEFAULT_MAX_SCORE,
+                 p1_full_combo=None, p2_full_combo=None, time=None):
+        """
+        Immutable-by-convention view of a single ddrcv score update.
+
+        Snapshots are small, picklable and free of any pygame state, so they can be handed
+        across threads or sent over multiprocessing pipes to render workers.
+
+        Args:
+            state (str): ddrcv state name (e.g. 'song_playing'). None if no message has been received.
+            p1_score (int): Player 1 score, clamped to >= 0. None if player 1 is not playing.
+            p2_score (int): Player 2 score, clamped to >= 0. None if player 2 is not playing.
+            p1_max_score (int): Maximum attainable score for player 1.
+            p2_max_score (int): Maximum attainable score for player 2.
+            p1_full_combo (bool): Whether player 1 still has a full combo. None if the feed doesn't report it.
+            p2_full_combo (bool): Whether player 2 still has a full combo. None if the feed doesn't report it.
+            time (datetime): Time the underlying message was received.
+        """
+        self.state = state
+        self.p1_score = p1_score
+        self.p2_score = p2_score
+        self.p1_max_score = p1_max_score
+        self.p2_max_score = p2_max_score
+        self.p1_full_combo = p1_full_combo
+        self.p2_full_combo = p2_full_combo
+        self.time = time
+
+    @classmethod
+    def from_message(cls, message, use_ex_score=False):
+        """
+        Build a snapshot from a raw ddrcv WebSocket message.
+
+        Args:
+            message (str, dict): JSON encoded message, or an already decoded message dict.
+            use_ex_score (bool): Use the EX score maxima reported in the song info instead of 1,000,000.
+
+        Returns:
+            ScoreSnapshot: The parsed snapshot.
+
+        Raises:
+            ValueError: If the message is not valid JSON.
+        """
+        msg = json.loads(message) if isinstance(message, (str, bytes)) else message
+        snapshot = cls(state=msg.get('state'), time=datetime.now())
+
+        if use_ex_score:
+            song = msg.get('song') or {}
+            p1_info = song.get('p1_info')
+            p2_info = song.get('p2_info')
+            if p1_info is not None:
+                snapshot.p1_max_score = p1_info['max_ex_score']
+            if p2_info is not None:
+                snapshot.p2_max_score = p2_info['max_ex_score']
+
+        score = msg.get('score') or {}
+        p1_score = score.get('p1_score', None)
+        p2_score = score.get('p2_score', None)
+        snapshot.p1_score = None if p1_score is None else max(0, p1_score)
+        snapshot.p2_score = None if p2_score is None else max(0, p2_score)
+        snapshot.p1_full_combo = score.get('p1_full_combo', None)
+        snapshot.p2_full_combo = score.get('p2_full_combo', None)
+        return snapshot
+
+    @property
+    def playing(self):
+        """bool: Whether a song is currently being played."""
+        return self.state == 'song_playing'
+
+    @property
+    def p1_percent(self):
+        """float: Player 1 score as a percentage of the maximum, or None."""
+        if self.p1_score is None:
+            return None
+        return 100 * (self.p1_score / self.p1_max_score)
+
+    @property
+    def p2_percent(self):
+        """float: Player 2 score as a percentage of the maximum, or None."""
+        if self.p2_score is None:
+            return None
+        return 100 * (self.p2_score / self.p2_max_score)
+
+    @property
+    def diff(self):
+        """int: Player 1 score minus player 2 score, or None unless both players are playing."""
+        if self.p1_score is None or self.p2_score is None:
+            return None
+        return self.p1_score - self.p2_score
+
+    @property
+    def p1_lead(self):
+        """int: How far player 1 is ahead of player 2, or None unless player 1 is strictly ahead."""
+        diff = self.diff
+        return diff if diff is not None and diff > 0 else None
+
+    @property
+    def p2_lead(self):
+        """int: How far player 2 is ahead of player 1, or None unless player 2 is strictly ahead."""
+        diff = self.diff
+        return -diff if diff is not None and diff < 0 else None
+
+    def __repr__(self):
+        return (f"ScoreSnapshot(state={self.state!r}, p1_score={self.p1_score!r}, p2_score={self.p2_score!r}, "
+                f"p1_max_score={self.p1_max_score!r}, p2_max_score={self.p2_max_score!r})")
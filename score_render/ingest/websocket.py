@@ -2,6 +2,19 @@ import time
 import asyncio
 import websockets
 
+from score_render.metrics import REGISTRY
+
+MESSAGES = REGISTRY.counter('score_render_websocket_messages_total', "WebSocket messages received")
+ERRORS = REGISTRY.counter('score_render_websocket_errors_total', "WebSocket connections lost to an error")
+CALLBACK_ERRORS = REGISTRY.counter('score_render_websocket_callback_errors_total', "Exceptions raised by the message callback")
+RECONNECTS = REGISTRY.counter('score_render_websocket_reconnects_total', "WebSocket reconnection attempts")
+CONNECTED = REGISTRY.gauge('score_render_websocket_connected', "Whether the WebSocket is connected (1) or not (0)")
+
+
+class _CallbackError(Exception):
+    """Wraps an exception raised by the message callback, to tell it apart from connection errors."""
+
+
 class WebSocketClient:
     def __init__(self, uri, on_message_callback):
         """
@@ -22,9 +35,11 @@ class WebSocketClient:
         try:
             async with websockets.connect(self.uri) as websocket:
                 self.websocket = websocket
+                CONNECTED.set(1)
                 await self.listen(websocket)
         finally:
             # Ensure the connection is properly closed
+            CONNECTED.set(0)
             self.running = False
             self.websocket = None
             print("WebSocket connection closed.")
@@ -34,13 +49,22 @@ class WebSocketClient:
         try:
             while self.running:
                 message = await websocket.recv()
+                MESSAGES.inc()
                 if self.on_message_callback:
-                    self.on_message_callback(message)
+                    try:
+                        self.on_message_callback(message)
+                    except Exception as e:
+                        raise _CallbackError(e) from e
+        except _CallbackError as e:
+            CALLBACK_ERRORS.inc()  # Counted here only, not as a connection error as well
+            print(f"Error in message callback: {e}")
         except websockets.exceptions.ConnectionClosedOK:
             print("WebSocket closed by the server.")
         except websockets.exceptions.ConnectionClosedError as e:
+            ERRORS.inc()
             print(f"WebSocket connection error: {e}")
         except Exception as e:
+            ERRORS.inc()
             print(f"Unexpected error: {e}")
 
     async def close(self):
@@ -67,10 +91,15 @@ class WebSocketHandler:
 
     def start(self):
         """Start the WebSocket client and manage reconnection."""
+        first = True
         while self.running:
+            if not first:
+                RECONNECTS.inc()
+            first = False
             try:
                 asyncio.run(self.connect_and_listen())
             except Exception as e:
+                ERRORS.inc()
                 print(f"WebSocket connection failed: {e}. Retrying in {self.reconnect_delay} seconds...")
                 time.sleep(self.reconnect_delay)
 
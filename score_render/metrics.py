@@ -0,0 +1,429 @@
+"""
+Lightweight Prometheus-style metrics.
+
+Counters and histograms are sharded per thread: each thread only ever writes its own shard, so
+updates on the hot path take no lock and cannot lose increments. Shards are summed when the
+metrics are collected. Values computed elsewhere (governor, memory, caches) come from collector
+callbacks, which the render thread runs through `Registry.publish`: the state they read is only
+ever touched by that thread, and scrapes serve the last published values.
+
+    from score_render.metrics import REGISTRY
+
+    MESSAGES = REGISTRY.counter('score_render_messages_total', "Messages received")
+    MESSAGES.inc()
+    REGISTRY.serve(9100)  # GET http://127.0.0.1:9100/metrics
+    REGISTRY.publish()    # From the render loop, e.g. once per second
+"""
+import bisect
+import math
+from threading import Thread, get_ident
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# Frame time buckets around common frame budgets (60, 30 and 15 FPS)
+FRAME_TIME_BUCKETS = (0.002, 0.005, 0.01, 1 / 60, 0.025, 1 / 30, 0.05, 1 / 15, 0.1, 0.25, 0.5, 1.0)
+
+
+def _format_value(value):
+    if value is None:
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for value in labels.values())
+    return '{' + ','.join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + '}'
+
+
+class Counter:
+    kind = 'counter'
+
+    def __init__(self, name, help=''):
+        """
+        Monotonically increasing count (e.g. messages received, errors).
+
+        Args:
+            name (str): Metric name, conventionally ending in '_total'.
+            help (str): Description shown in the exposition.
+        """
+        self.name = name
+        self.help = help
+        self.shards = {}
+
+    def inc(self, amount=1):
+        """
+        Increase the counter. Safe to call from any thread without locking.
+
+        Args:
+            amount (float): Non-negative increment.
+        """
+        ident = get_ident()
+        self.shards[ident] = self.shards.get(ident, 0) + amount
+
+    @property
+    def value(self):
+        """float: Current total across all threads."""
+        return sum(self.shards.copy().values())
+
+    def samples(self):
+        return [(self.name, {}, self.value)]
+
+
+class Gauge:
+    kind = 'gauge'
+
+    def __init__(self, name, help='', function=None):
+        """
+        Value that can go up and down (e.g. connection state, current quality tier).
+
+        Args:
+            name (str): Metric name.
+            help (str): Description shown in the exposition.
+            function (callable): Zero-argument callable returning the value at collection time. If
+                given, `set` is not used.
+        """
+        self.name = name
+        self.help = help
+        self.function = function
+        self.current = 0
+
+    def set(self, value):
+        """
+        Set the gauge. A single attribute store, so safe to call from any thread.
+
+        Args:
+            value (float): New value.
+        """
+        self.current = value
+
+    @property
+    def value(self):
+        """float: Current value."""
+        return self.function() if self.function is not None else self.current
+
+    def samples(self):
+        return [(self.name, {}, self.value)]
+
+
+class Histogram:
+    kind = 'histogram'
+
+    def __init__(self, name, help='', buckets=DEFAULT_BUCKETS):
+        """
+        Distribution of observed values (e.g. frame times) over fixed buckets.
+
+        Args:
+            name (str): Metric name.
+            help (str): Description shown in the exposition.
+            buckets (tuple): Increasing upper bounds of the buckets; +Inf is added implicitly.
+        """
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        self.shards = {}
+
+    def observe(self, value):
+        """
+        Record an observation. Safe to call from any thread without locking.
+
+        Args:
+            value (float): Observed value.
+        """
+        ident = get_ident()
+        shard = self.shards.get(ident)
+        if shard is None:
+            # Per-bucket counts (last one is +Inf), then the sum of observations
+            shard = self.shards[ident] = [0] * (len(self.buckets) + 2)
+        shard[bisect.bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    def snapshot(self):
+        """
+        Merge the per-thread shards.
+
+        Returns:
+            tuple: (per-bucket counts including +Inf, sum of observations).
+        """
+        merged = [0] * (len(self.buckets) + 2)
+        for shard in list(self.shards.copy().values()):
+            for i, value in enumerate(list(shard)):
+                merged[i] += value
+        return merged[:-1], merged[-1]
+
+    def samples(self):
+        counts, total = self.snapshot()
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), counts):
+            cumulative += count
+            samples.append((f'{self.name}_bucket', {'le': _format_value(bound)}, cumulative))
+        samples.append((f'{self.name}_sum', {}, total))
+        samples.append((f'{self.name}_count', {}, cumulative))
+        return samples
+
+
+class Registry:
+    def __init__(self):
+        """
+        Collection of metrics and collector callbacks, rendered in the Prometheus text format.
+        """
+        self.metrics = {}
+        self.collectors = []
+        self.published = []
+        self.server = None
+
+    def _get_or_create(self, cls, name, *args, **kwargs):
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics.setdefault(name, cls(name, *args, **kwargs))
+        if not isinstance(metric, cls):
+            raise ValueError(f"Metric '{name}' is already registered as a {metric.kind}")
+        return metric
+
+    def counter(self, name, help=''):
+        """
+        Get the counter with this name, creating it if needed.
+
+        Args:
+            name (str): Metric name.
+            help (str): Description shown in the exposition.
+
+        Returns:
+            Counter: The counter.
+        """
+        return self._get_or_create(Counter, name, help)
+
+    def gauge(self, name, help='', function=None):
+        """
+        Get the gauge with this name, creating it if needed.
+
+        Args:
+            name (str): Metric name.
+            help (str): Description shown in the exposition.
+            function (callable): Zero-argument callable returning the value at collection time.
+
+        Returns:
+            Gauge: The gauge.
+        """
+        gauge = self._get_or_create(Gauge, name, help)
+        if function is not None:
+            gauge.function = function
+        return gauge
+
+    def histogram(self, name, help='', buckets=DEFAULT_BUCKETS):
+        """
+        Get the histogram with this name, creating it if needed.
+
+        Args:
+            name (str): Metric name.
+            help (str): Description shown in the exposition.
+            buckets (tuple): Increasing upper bounds of the buckets.
+
+        Returns:
+            Histogram: The histogram.
+        """
+        return self._get_or_create(Histogram, name, help, buckets)
+
+    def register_collector(self, collector):
+        """
+        Add a callback producing metrics when `publish` is called.
+
+        Collectors run on the thread calling `publish`, never on the thread serving scrapes, so they
+        can walk state owned by the render thread (deques, LRU caches) without locking.
+
+        Args:
+            collector (callable): Zero-argument callable returning an iterable of
+                (name, kind, help, labels, value) tuples. Samples sharing a name form one metric.
+        """
+        self.collectors.append(collector)
+
+    def publish(self):
+        """
+        Run the collectors and keep their samples for the following scrapes. Call periodically from
+        the thread that owns the collected state (the render loop). A collector that raises is
+        reported and left out until the next publish.
+        """
+        published = []
+        for collector in list(self.collectors):
+            try:
+                published.extend(collector())
+            except Exception as e:
+                print(f"Metrics collector {collector!r} failed: {e}")
+        self.published = published  # Swapped in whole, so a scrape never sees a partial publish
+
+    def exposition(self):
+        """
+        Render every metric, and the last published collector samples, in the Prometheus text
+        exposition format (version 0.0.4).
+
+        Returns:
+            str: The metrics page.
+        """
+        families = {}
+        for metric in list(self.metrics.values()):
+            families[metric.name] = (metric.kind, metric.help, metric.samples())
+        for name, kind, help, labels, value in self.published:
+            families.setdefault(name, (kind, help, []))[2].append((name, labels, value))
+
+        lines = []
+        for name, (kind, help, samples) in families.items():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(f"{sample}{_format_labels(labels)} {_format_value(value)}" for sample, labels, value in samples)
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port=9100, host='127.0.0.1'):
+        """
+        Serve the metrics page at http://<host>:<port>/metrics from a daemon thread.
+
+        Metrics must never take the overlay down, so a port that cannot be bound (e.g. already in use
+        by another overlay) is reported and the overlay keeps running without an endpoint.
+
+        Args:
+            port (int): TCP port.
+            host (str): Interface to bind; use '0.0.0.0' to allow scraping from other machines.
+
+        Returns:
+            http.server.ThreadingHTTPServer: The running server (see `stop`), or None if it could not start.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.exposition().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Scrapes every few seconds would flood the console
+
+        try:
+            self.server = ThreadingHTTPServer((host, port), MetricsHandler)
+        except OSError as e:
+            print(f"Cannot serve metrics on {host}:{port}: {e}. Continuing without a metrics endpoint.")
+            return None
+        self.server.daemon_threads = True
+        thread = Thread(target=self.server.serve_forever, name='metrics-server', daemon=True)
+        thread.start()
+        return self.server
+
+    def stop(self):
+        """Stop the metrics server, if running."""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+REGISTRY = Registry()
+
+
+class FrameMetrics:
+    def __init__(self, fps, registry=REGISTRY, prefix='score_render'):
+        """
+        Frame loop instrumentation: frame work time histogram, dropped frame counter and achieved FPS.
+
+        Args:
+            fps (int): Target frame rate of the loop.
+            registry (Registry): Registry to create the metrics in.
+            prefix (str): Metric name prefix.
+        """
+        self.fps = fps
+        self.frame_time = registry.histogram(f'{prefix}_frame_seconds', "Time spent producing each frame", FRAME_TIME_BUCKETS)
+        self.frames = registry.counter(f'{prefix}_frames_total', "Frames rendered")
+        self.dropped = registry.counter(f'{prefix}_dropped_frames_total', "Frames skipped because the previous frame ran late")
+        self.achieved_fps = registry.gauge(f'{prefix}_fps', "Frame rate over the last frame interval")
+
+    def record(self, frame_time, interval):
+        """
+        Record one frame.
+
+        Args:
+            frame_time (float): Seconds spent producing the frame (e.g. `clock.get_rawtime() / 1000`).
+            interval (float): Seconds since the previous frame (e.g. `clock.tick(fps) / 1000`).
+        """
+        self.frames.inc()
+        self.frame_time.observe(frame_time)
+        if interval > 0:
+            self.achieved_fps.set(1 / interval)
+            # Whole frame slots that passed without a frame
+            missed = int(interval * self.fps + 0.5) - 1
+            if missed > 0:
+                self.dropped.inc(missed)
+
+
+def quality_collector(governor, prefix='score_render'):
+    """
+    Collector exposing a `QualityGovernor`'s state.
+
+    Args:
+        governor (QualityGovernor): The governor.
+        prefix (str): Metric name prefix.
+
+    Returns:
+        callable: Collector for `Registry.register_collector`.
+    """
+    def collect():
+        metrics = governor.metrics()
+        yield f'{prefix}_quality_tier', 'gauge', "Current quality tier index (0 is highest)", {'tier': metrics['tier']}, metrics['tier_index']
+        yield f'{prefix}_quality_downgrades_total', 'counter', "Quality tier downgrades", {}, metrics['downgrades']
+        yield f'{prefix}_quality_upgrades_total', 'counter', "Quality tier upgrades", {}, metrics['upgrades']
+        if metrics['frame_time_p90'] is not None:
+            yield f'{prefix}_frame_seconds_p90', 'gauge', "90th percentile frame time over the governor window", {}, metrics['frame_time_p90']
+    return collect
+
+
+def memory_collector(registry, prefix='score_render'):
+    """
+    Collector exposing a `MemoryRegistry`'s totals and evictions.
+
+    Args:
+        registry (MemoryRegistry): The memory registry.
+        prefix (str): Metric name prefix.
+
+    Returns:
+        callable: Collector for `Registry.register_collector`.
+    """
+    def collect():
+        metrics = registry.metrics()
+        yield f'{prefix}_memory_bytes', 'gauge', "Memory held by elements and caches", {'category': 'total'}, metrics['total']
+        for category, nbytes in metrics['categories'].items():
+            yield f'{prefix}_memory_bytes', 'gauge', "Memory held by elements and caches", {'category': category}, nbytes
+        if metrics['budget'] is not None:
+            yield f'{prefix}_memory_budget_bytes', 'gauge', "Memory budget", {}, metrics['budget']
+        for category, count in metrics['evictions'].items():
+            yield f'{prefix}_memory_evictions_total', 'counter', "Entries evicted to stay within budget", {'category': category}, count
+    return collect
+
+
+def text_cache_collector(cache, prefix='score_render'):
+    """
+    Collector exposing a `TextLayoutCache`'s hit and miss counts.
+
+    Args:
+        cache (TextLayoutCache): The text cache.
+        prefix (str): Metric name prefix.
+
+    Returns:
+        callable: Collector for `Registry.register_collector`.
+    """
+    def collect():
+        for name, stats in cache.stats().items():
+            yield f'{prefix}_text_cache_hits_total', 'counter', "Text cache lookups served from the cache", {'cache': name}, stats['hits']
+            yield f'{prefix}_text_cache_misses_total', 'counter', "Text cache lookups that had to compute the value", {'cache': name}, stats['misses']
+            yield f'{prefix}_text_cache_entries', 'gauge', "Entries held by the text cache", {'cache': name}, stats['entries']
+    return collect
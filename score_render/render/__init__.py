@@ -0,0 +1,21 @@
+from score_render._lazy import lazy_exports
+
+# Render workers only need `.worker` and `.frame_buffer`; the supervisor, layouts and governors pull in
+# websockets and every element, so nothing is imported until a name is used
+_EXPORTS = {
+    'SharedFrameBuffer': '.frame_buffer',
+    'PanelSpec': '.worker',
+    'RenderSupervisor': '.supervisor',
+    'QualityGovernor': '.quality',
+    'QualityTier': '.quality',
+    'DEFAULT_TIERS': '.quality',
+    'OverlayLayout': '.layout',
+    'LayoutWatcher': '.layout',
+    'load_layout_file': '.layout',
+    'MemoryRegistry': '.memory',
+    'Viewport': '.viewport',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,89 @@
+import struct
+from multiprocessing import shared_memory
+
+# Header layout: frame sequence number (uint64), width (uint32), height (uint32)
+_HEADER = struct.Struct('<QII')
+
+
+class SharedFrameBuffer:
+    def __init__(self, size, name=None, create=True):
+        """
+        Double-buffered RGB frame shared between a render worker and its consumer.
+
+        The writer always fills the slot that is *not* currently published and then bumps the
+        sequence number, so a reader never observes a half-written frame unless it is lapped twice
+        while copying.
+
+        Args:
+            size (tuple): (width, height) of the frames.
+            name (str): Shared memory block name. Required when attaching (create=False).
+            create (bool): Whether to allocate a new block or attach to an existing one.
+        """
+        self.width, self.height = size
+        self.frame_bytes = self.width * self.height * 3
+        total = _HEADER.size + 2 * self.frame_bytes
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=total if create else 0)
+        self.owner = create
+        if create:
+            _HEADER.pack_into(self.shm.buf, 0, 0, self.width, self.height)
+
+    @property
+    def name(self):
+        """str: Name of the underlying shared memory block, used to attach from another process."""
+        return self.shm.name
+
+    @property
+    def sequence(self):
+        """int: Number of frames written so far."""
+        return _HEADER.unpack_from(self.shm.buf, 0)[0]
+
+    def _slot(self, index):
+        start = _HEADER.size + (index % 2) * self.frame_bytes
+        return start, start + self.frame_bytes
+
+    def write(self, surface):
+        """
+        Publish a new frame.
+
+        Args:
+            surface (pygame.Surface): Surface of exactly `size` to copy into the buffer.
+        """
+        import pygame
+
+        sequence = self.sequence
+        start, end = self._slot(sequence + 1)
+        self.shm.buf[start:end] = pygame.image.tobytes(surface, 'RGB')
+        _HEADER.pack_into(self.shm.buf, 0, sequence + 1, self.width, self.height)
+
+    def read(self):
+        """
+        Copy the most recently published frame.
+
+        Returns:
+            tuple: (sequence, bytes) of the latest frame, or (0, None) if nothing has been written yet.
+        """
+        sequence = self.sequence
+        if sequence == 0:
+            return 0, None
+        start, end = self._slot(sequence)
+        return sequence, bytes(self.shm.buf[start:end])
+
+    def read_surface(self):
+        """
+        Copy the most recently published frame into a new surface.
+
+        Returns:
+            pygame.Surface: The latest frame, or None if nothing has been written yet.
+        """
+        import pygame
+
+        _, data = self.read()
+        if data is None:
+            return None
+        return pygame.image.frombytes(data, (self.width, self.height), 'RGB')
+
+    def close(self):
+        """Detach from the shared memory block, releasing it if this buffer created it."""
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
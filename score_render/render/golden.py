@@ -0,0 +1,364 @@
+"""
+Deterministic golden-frame regression harness.
+
+Renders fixed scenes headlessly and compares them against stored golden images with a per-pixel
+tolerance and a perceptual (SSIM) threshold. On failure, the actual frame and a diff image are
+written next to each other for inspection.
+
+    python -m score_render.render.golden              # compare against golden/
+    python -m score_render.render.golden --update     # re-record the golden images
+
+A scene without a golden image fails, so a new or renamed scene has to be recorded with --update.
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+GOLDEN_DIR = Path(__file__).resolve().parent.parent.parent / 'golden'
+AFC_LAYOUT = Path(__file__).resolve().parent.parent.parent / 'apps' / 'layouts' / 'afc.json'
+SCENE_SIZE = (288, 162)
+BACKGROUND = (255, 0, 0)
+
+SCENES = {}
+
+
+def scene(name):
+    """Register a function `render(screen)` drawing a fixed scene onto a blank `SCENE_SIZE` surface."""
+    def register(render):
+        SCENES[name] = render
+        return render
+    return register
+
+
+def _init_headless():
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    import pygame
+
+    if not pygame.get_init():
+        pygame.init()
+    if pygame.display.get_surface() is None:
+        # Required for Surface.convert_alpha()
+        pygame.display.set_mode((1, 1))
+    return pygame
+
+
+def _snapshot(p1_score, p2_score):
+    from score_render.ingest import ScoreSnapshot
+
+    return ScoreSnapshot(state='song_playing', p1_score=p1_score, p2_score=p2_score)
+
+
+def _afc_layout(shadow_mode=None):
+    from score_render.render.layout import OverlayLayout, load_layout_file
+
+    data = load_layout_file(AFC_LAYOUT)
+    if shadow_mode is not None:
+        for element in data['elements']:
+            if element['type'] == 'text':
+                element['shadow_mode'] = shadow_mode
+    layout = OverlayLayout()
+    layout.apply(data)
+    return layout
+
+
+def _settle(layout, snapshot, seconds=2.0, dt=0.25):
+    for _ in range(int(seconds / dt)):
+        layout.update(snapshot, dt)
+
+
+@scene('afc_p1_leading')
+def _afc_p1_leading(screen):
+    layout = _afc_layout()
+    _settle(layout, _snapshot(987654, 876543))
+    layout.draw(screen)
+
+
+@scene('afc_p2_only')
+def _afc_p2_only(screen):
+    layout = _afc_layout()
+    _settle(layout, _snapshot(None, 543210))
+    layout.draw(screen)
+
+
+@scene('afc_sdf_shadows')
+def _afc_sdf_shadows(screen):
+    layout = _afc_layout(shadow_mode='sdf')
+    _settle(layout, _snapshot(876543, 987654))
+    layout.draw(screen)
+
+
+@scene('sdf_shadow_glyph_positions')
+def _sdf_shadow_glyph_positions(screen):
+    # Strings whose glyphs overhang their origin, where per-glyph fields placed at integer advances drifted
+    import pygame
+    from score_render import ASSETS_DIR
+    from score_render.elements import TextBox
+    from score_render.elements.text_box import TextShadow
+
+    font = pygame.font.Font(ASSETS_DIR / 'fonts' / 'ChangaOne-Italic.ttf', 36)
+    shadows = [TextShadow((0, 0, 0), 4, (4, 4)), TextShadow((0, 102, 255), 3, (3, 3)), TextShadow((0, 0, 0), 2, (1, 1))]
+    for i, text in enumerate(('+12345', '42.42%', '24.27%', '+24242')):
+        text_box = TextBox(text, font=font, color=(255, 255, 255), shadow=shadows, shadow_mode='sdf')
+        text_box.set_position(6 + 144 * (i % 2), 12 + 72 * (i // 2))
+        text_box.draw(screen)
+
+
+@scene('afc_lead_change')
+def _afc_lead_change(screen):
+    # Mid-tween counters with the lead-change fireball part way through
+    layout = _afc_layout()
+    _settle(layout, _snapshot(800000, 900000))
+    layout.update(_snapshot(950000, 900000), 0.2)
+    layout.draw(screen)
+
+
+def _fireball(**kwargs):
+    from score_render import ASSETS_DIR
+    from score_render.elements import AnimationPNG
+
+    return AnimationPNG(ASSETS_DIR / 'graphics' / 'fireballs' / 'PNGS' / 'type_01' / 'blue',
+                        duration=0.5, interpolation_frames=5, scale_to=(144, 81), **kwargs)
+
+
+def _fireball_scene(screen, animation):
+    screen.fill(BACKGROUND)
+    for i, t in enumerate((0.0, 0.13, 0.29, 0.41)):
+        animation.current_time = t
+        animation.draw(screen, (36 + 72 * i, 81))
+
+
+@scene('fireball_frames')
+def _fireball_frames(screen):
+    _fireball_scene(screen, _fireball())
+
+
+@scene('fireball_intensity_tinted')
+def _fireball_intensity_tinted(screen):
+    _fireball_scene(screen, _fireball(storage='intensity', tint=(255, 0, 255)))
+
+
+@scene('particles_seeded')
+def _particles_seeded(screen):
+    import math
+    from score_render.elements import ParticleTrail
+
+    trail = ParticleTrail(color=(0, 0, 0), max_particles=200, particle_lifetime=40, seed=1234)
+    for frame in range(60):
+        trail.emit(144 + 100 * math.sin(frame / 10), 30)
+        trail.update()
+    screen.fill((255, 255, 255))
+    trail.draw(screen)
+
+
+def _burst(screen, blend):
+    from score_render.elements import ParticleTrail
+
+    trail = ParticleTrail(color=(255, 255, 255), max_particles=3000, particle_lifetime=40, seed=1234, blend=blend)
+    trail.emit_batch(2000, 144, 81, shape='circle', extent=20, velocity='radial', speed=(0.5, 2.5),
+                     lifetime=(20, 40), color_ramp=[(255, 255, 160), (255, 120, 0), (120, 0, 40)])
+    trail.emit_batch(500, 144, 140, shape='line', extent=100, velocity='normal', vx=(-0.5, 0.5), vy=(-2, -1),
+                     color_ramp=[(80, 160, 255), (0, 40, 120)])
+    for _ in range(12):
+        trail.update()
+    screen.fill((0, 0, 0))
+    trail.draw(screen)
+
+
+@scene('particles_burst_alpha')
+def _particles_burst_alpha(screen):
+    _burst(screen, 'alpha')
+
+
+@scene('particles_burst_add')
+def _particles_burst_add(screen):
+    _burst(screen, 'add')
+
+
+@scene('particles_burst_max')
+def _particles_burst_max(screen):
+    _burst(screen, 'max')
+
+
+def render_scene(name):
+    """
+    Render a registered scene.
+
+    Args:
+        name (str): Scene name.
+
+    Returns:
+        np.ndarray: (width, height, 3) uint8 RGB frame.
+    """
+    pygame = _init_headless()
+    screen = pygame.Surface(SCENE_SIZE)
+    screen.fill(BACKGROUND)
+    SCENES[name](screen)
+    return pygame.surfarray.array3d(screen)
+
+
+def _box_mean(image, window):
+    # Mean over window x window neighbourhoods ('valid' region) via summed-area tables
+    table = np.pad(image, ((1, 0), (1, 0))).cumsum(0).cumsum(1)
+    total = table[window:, window:] - table[:-window, window:] - table[window:, :-window] + table[:-window, :-window]
+    return total / (window * window)
+
+
+def ssim(actual, expected, window=7):
+    """
+    Mean structural similarity of the luminance of two RGB frames.
+
+    Args:
+        actual (np.ndarray): (w, h, 3) uint8 frame.
+        expected (np.ndarray): (w, h, 3) uint8 frame.
+        window (int): Side of the square comparison window.
+
+    Returns:
+        float: SSIM in [-1, 1]; 1 means identical.
+    """
+    weights = np.array([0.299, 0.587, 0.114])
+    x = actual.astype(np.float64) @ weights
+    y = expected.astype(np.float64) @ weights
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+
+    mu_x, mu_y = _box_mean(x, window), _box_mean(y, window)
+    var_x = _box_mean(x * x, window) - mu_x ** 2
+    var_y = _box_mean(y * y, window) - mu_y ** 2
+    cov = _box_mean(x * y, window) - mu_x * mu_y
+    ssim_map = ((2 * mu_x * mu_y + c1) * (2 * cov + c2)) / ((mu_x ** 2 + mu_y ** 2 + c1) * (var_x + var_y + c2))
+    return float(ssim_map.mean())
+
+
+class CompareResult:
+    def __init__(self, passed, bad_fraction, max_diff, ssim, diff_image):
+        """
+        Outcome of comparing a frame against its golden image.
+
+        Args:
+            passed (bool): Whether both the per-pixel and the perceptual checks passed.
+            bad_fraction (float): Fraction of pixels whose largest channel difference exceeds the tolerance.
+            max_diff (int): Largest channel difference over the whole frame.
+            ssim (float): Structural similarity of the luminance.
+            diff_image (np.ndarray): (w, h, 3) uint8 visualization: amplified differences in gray,
+                out-of-tolerance pixels in red.
+        """
+        self.passed = passed
+        self.bad_fraction = bad_fraction
+        self.max_diff = max_diff
+        self.ssim = ssim
+        self.diff_image = diff_image
+
+    def __repr__(self):
+        return (f"CompareResult(passed={self.passed}, bad_fraction={self.bad_fraction:.5f}, "
+                f"max_diff={self.max_diff}, ssim={self.ssim:.4f})")
+
+
+def compare(actual, expected, pixel_tolerance=16, max_bad_fraction=0.002, min_ssim=0.98):
+    """
+    Compare a frame against a golden image.
+
+    Args:
+        actual (np.ndarray): (w, h, 3) uint8 rendered frame.
+        expected (np.ndarray): (w, h, 3) uint8 golden frame.
+        pixel_tolerance (int): Largest per-channel difference a pixel may have without counting as bad.
+        max_bad_fraction (float): Largest fraction of bad pixels allowed.
+        min_ssim (float): Smallest structural similarity allowed.
+
+    Returns:
+        CompareResult: The comparison outcome. Frames of different sizes always fail.
+    """
+    if actual.shape != expected.shape:
+        return CompareResult(False, 1.0, 255, -1.0, np.zeros_like(actual))
+
+    diff = np.abs(actual.astype(np.int16) - expected.astype(np.int16)).max(axis=2)
+    bad = diff > pixel_tolerance
+    bad_fraction = float(bad.mean())
+    similarity = ssim(actual, expected)
+
+    diff_image = np.repeat(np.clip(diff * 4, 0, 255).astype(np.uint8)[:, :, None], 3, axis=2)
+    diff_image[bad] = (255, 0, 0)
+
+    passed = bad_fraction <= max_bad_fraction and similarity >= min_ssim
+    return CompareResult(passed, bad_fraction, int(diff.max()), similarity, diff_image)
+
+
+def run(names=None, golden_dir=GOLDEN_DIR, output_dir=None, update=False, **tolerances):
+    """
+    Render scenes and compare them against (or record them as) golden images.
+
+    Args:
+        names (list[str]): Scenes to run. All registered scenes if None.
+        golden_dir (Path): Directory holding '<scene>.png' golden images.
+        output_dir (Path): Where '<scene>.actual.png' and '<scene>.diff.png' are written for failing
+            scenes. Defaults to '<golden_dir>/failures'.
+        update (bool): Record the rendered frames as the new golden images instead of comparing.
+        **tolerances: Forwarded to `compare`.
+
+    Returns:
+        dict: Scene name -> CompareResult, or None for scenes that were recorded. Scenes without a
+        golden image get a failed result.
+    """
+    pygame = _init_headless()
+    golden_dir = Path(golden_dir)
+    output_dir = Path(output_dir) if output_dir is not None else golden_dir / 'failures'
+    results = {}
+
+    for name in names or sorted(SCENES):
+        actual = render_scene(name)
+        golden_path = golden_dir / f'{name}.png'
+
+        if update:
+            golden_dir.mkdir(parents=True, exist_ok=True)
+            pygame.image.save(pygame.surfarray.make_surface(actual), golden_path)
+            results[name] = None
+            continue
+
+        if not golden_path.exists():
+            print(f"{name}: no golden image at {golden_path} (run with --update to record it)")
+            results[name] = CompareResult(False, 1.0, 255, -1.0, np.zeros_like(actual))
+            continue
+
+        expected = pygame.surfarray.array3d(pygame.image.load(golden_path))
+        result = compare(actual, expected, **tolerances)
+        results[name] = result
+        if not result.passed:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            pygame.image.save(pygame.surfarray.make_surface(actual), output_dir / f'{name}.actual.png')
+            pygame.image.save(pygame.surfarray.make_surface(result.diff_image), output_dir / f'{name}.diff.png')
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render fixed scenes and compare them against golden images.")
+    parser.add_argument('scenes', nargs='*', help=f"Scenes to run (default: all). Available: {', '.join(sorted(SCENES))}")
+    parser.add_argument('--update', action='store_true', help="Record the rendered frames as the new golden images")
+    parser.add_argument('--golden-dir', type=Path, default=GOLDEN_DIR, help="Directory holding the golden images")
+    parser.add_argument('--output-dir', type=Path, default=None, help="Where to write actual/diff images of failures")
+    parser.add_argument('--pixel-tolerance', type=int, default=16)
+    parser.add_argument('--max-bad-fraction', type=float, default=0.002)
+    parser.add_argument('--min-ssim', type=float, default=0.98)
+    args = parser.parse_args()
+
+    unknown = [name for name in args.scenes if name not in SCENES]
+    if unknown:
+        parser.error(f"Unknown scenes: {unknown}")
+
+    results = run(args.scenes or None, args.golden_dir, args.output_dir, args.update,
+                  pixel_tolerance=args.pixel_tolerance, max_bad_fraction=args.max_bad_fraction, min_ssim=args.min_ssim)
+
+    failed = False
+    for name, result in results.items():
+        if result is None:
+            print(f"{name}: recorded")
+            continue
+        failed |= not result.passed
+        print(f"{name}: {'ok' if result.passed else 'FAILED'} ({result!r})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
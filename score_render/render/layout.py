@@ -0,0 +1,441 @@
+import json
+import os
+import queue
+import time
+from pathlib import Path
+from threading import Thread
+
+import pygame
+
+from score_render import ASSETS_DIR
+from score_render.elements import TextBox, TextLayoutCache, AnimationPNG, Timeline, TweenedValue, ScoreEvents
+from score_render.elements.text_box import TextShadow
+from score_render.elements.sdf import SdfTextRenderer
+from .viewport import Viewport
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+
+def load_layout_file(path):
+    """
+    Read a layout definition from a JSON or TOML file.
+
+    Args:
+        path (str, Path): Layout file. '.toml' files are parsed as TOML, anything else as JSON.
+
+    Returns:
+        dict: The raw layout definition.
+    """
+    path = Path(path)
+    if path.suffix == '.toml':
+        if tomllib is None:
+            raise RuntimeError("TOML layouts require Python 3.11+ (tomllib)")
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _asset_path(path):
+    if path is None:
+        return None
+    path = Path(path)
+    return path if path.is_absolute() else ASSETS_DIR / path
+
+
+class _TextElement:
+    def __init__(self, layout, definition, previous=None):
+        self.definition = definition
+        self.bind = definition.get('bind')
+        # A restyled element bound to the same value takes over what is on screen, so it doesn't restart from 0
+        if previous is None or self.bind is None or previous.bind != self.bind:
+            previous = None
+
+        shadows = [
+            TextShadow(tuple(shadow['color']), shadow.get('thickness', 5), tuple(shadow.get('offset', (0, 0))),
+                       shadow.get('softness', 0))
+            for shadow in definition.get('shadow') or []
+        ]
+        self.text_box = TextBox(
+            previous.text_box.text if previous is not None else definition.get('text', ''),
+            font=layout.font(definition.get('font'), definition.get('font_size', 36)),
+            color=tuple(definition.get('color', (0, 0, 0))),
+            bg_color=tuple(definition['bg_color']) if definition.get('bg_color') else None,
+            anchor=definition.get('anchor', 'topleft'),
+            padding=definition.get('padding', 10),
+            shadow=shadows,
+            cache=layout.text_cache,
+            shadow_mode=definition.get('shadow_mode', 'blit'),
+            sdf_renderer=layout.sdf_renderer,
+        )
+        self.text_box.set_position(*definition.get('position', (0, 0)))
+        self.format = definition.get('format', '{}')
+        self.visible = previous.visible if previous is not None else self.bind is None
+        self.value = None
+        if self.bind is not None and definition.get('tween'):
+            if previous is not None and previous.value is not None:
+                # Copy rather than take over the tween, so the previous element stays intact if the reload fails
+                self.value = previous.value.clone(duration=definition['tween'])
+            else:
+                self.value = TweenedValue(layout.timeline, duration=definition['tween'])
+
+    def update(self, snapshot, dt):
+        if self.bind is None:
+            return
+        value = getattr(snapshot, self.bind, None) if snapshot is not None and snapshot.playing else None
+        self.visible = value is not None
+        if value is None:
+            return
+        if self.value is not None:
+            self.value.set(value)
+            value = self.value.value
+            if isinstance(self.value.target, int):
+                value = round(value)
+        self.text_box.set_text(self.format.format(value))
+
+    def get_bounds(self):
+        return self.text_box.get_bounds()
+
+    def draw(self, screen):
+        if self.visible:
+            self.text_box.draw(screen)
+
+    def release(self, layout):
+        self.text_box.release()
+        if self.value is not None:
+            layout.timeline.release(self.value.handle)
+
+
+class _AnimationElement:
+    def __init__(self, layout, definition, previous=None):
+        self.definition = definition
+        self.trigger = definition.get('trigger')
+        self.position = tuple(definition.get('position', (0, 0)))
+        folder = _asset_path(definition['folder'])
+        interpolation_frames = definition.get('interpolation_frames', 3)
+        scale_to = tuple(definition['scale_to']) if definition.get('scale_to') else None
+        maintain_aspect_ratio = definition.get('maintain_aspect_ratio', True)
+        # Triggered animations play once per event; free-running ones loop unless told otherwise
+        loopable = definition.get('loopable', self.trigger is None)
+
+        storage = definition.get('storage', 'rgba')
+        tint = tuple(definition['tint']) if definition.get('tint') else None
+        hot_frames = definition.get('hot_frames')
+
+        # Frames are cached untinted; tinted variants share them and only swap the color ramp
+        key = (str(folder), interpolation_frames, scale_to, maintain_aspect_ratio, loopable, storage, hot_frames)
+        if key not in layout.baked_frames:
+            layout.baked_frames[key] = AnimationPNG(
+                folder, definition['duration'],
+                interpolation_frames=interpolation_frames,
+                scale_to=scale_to,
+                maintain_aspect_ratio=maintain_aspect_ratio,
+                loopable=loopable,
+                storage=storage,
+                hot_frames=hot_frames,
+            ).baked_frames
+        self.animation = AnimationPNG(
+            folder, definition['duration'],
+            interpolation_frames=interpolation_frames,
+            loopable=loopable,
+            baked_frames=layout.baked_frames[key],
+            tint=tint,
+        )
+
+        if previous is not None:
+            # Keep the playback position (or idle state) of the element being replaced
+            self.animation.current_time = min(previous.animation.current_time, self.animation.duration)
+        elif self.trigger is not None:
+            self.animation.current_time = self.animation.duration  # Idle until triggered
+
+    def on_event(self, event):
+        self.animation.restart()
+
+    def update(self, snapshot, dt):
+        self.animation.update(dt)
+
+    def get_bounds(self):
+        return self.animation.get_bounds(self.position)
+
+    def draw(self, screen):
+        if self.trigger is None or not self.animation.finished:
+            self.animation.draw(screen, self.position)
+
+    def release(self, layout):
+        pass
+
+
+_ELEMENT_TYPES = {
+    'text': _TextElement,
+    'animation': _AnimationElement,
+}
+
+
+class OverlayLayout:
+    def __init__(self, text_cache=None):
+        """
+        Overlay built from a data-driven layout definition, rebuilt incrementally on reload.
+
+        A layout definition (see `apps/layouts/afc.json`) has:
+            screen: {"size": [w, h], "background": [r, g, b]}
+            shadows: Named lists of {"color", "thickness", "offset"} shadow layers.
+            elements: Ordered list (draw order) of element tables with a unique "name" and a "type":
+                text: TextBox options (including "shadow_mode") plus "position", "shadow" (preset name
+                    or inline list of layers, which may set "softness"), and an optional "bind" to a
+                    `ScoreSnapshot` attribute with a str.format "format" and a "tween" duration in
+                    seconds. Bound text is hidden while the attribute is None or no song is playing.
+                animation: AnimationPNG options ("folder" relative to the assets directory, "storage",
+                    "tint", "hot_frames") plus "position" and an optional "trigger" naming a
+                    `ScoreEvents` event to play on.
+
+        Applying a new definition only rebuilds elements whose resolved definition changed. A rebuilt
+        element takes over the state of the one it replaces (displayed text, tweened value and target,
+        animation position), so restyling an element mid-song does not make it jump. Fonts and
+        baked animation frames are cached for the lifetime of the layout, so rebuilding an element
+        with a known font or animation never touches the disk.
+
+        Args:
+            text_cache (TextLayoutCache): Text cache shared by every text element. Created if None.
+        """
+        self.text_cache = text_cache if text_cache is not None else TextLayoutCache()
+        self.sdf_renderer = SdfTextRenderer()
+        self.fonts = {}
+        self.baked_frames = {}
+        self.timeline = Timeline()
+        self.events = ScoreEvents()
+        self.subscribed_events = set()
+        self.elements = {}
+        self.viewport = Viewport()
+        self.size = None
+        self.background = None
+        self.snapshot = None
+
+    def font(self, path, size):
+        """
+        Get a shared font, loading it on first use.
+
+        Args:
+            path (str): Font path relative to the assets directory, or None for the default font.
+            size (int): Font size.
+
+        Returns:
+            pygame.font.Font: The font.
+        """
+        key = (path, size)
+        if key not in self.fonts:
+            self.fonts[key] = pygame.font.Font(_asset_path(path), size)
+        return self.fonts[key]
+
+    @staticmethod
+    def resolve(data, events=None):
+        """
+        Expand shadow presets, check triggers and index elements by name.
+
+        Args:
+            data (dict): Raw layout definition.
+            events (ScoreEvents): Events whose names are valid triggers. Defaults to the built-in events.
+
+        Returns:
+            dict: Element name -> fully resolved element definition, in draw order.
+        """
+        presets = data.get('shadows', {})
+        triggers = (events if events is not None else ScoreEvents()).detectors
+        resolved = {}
+        for element in data.get('elements', []):
+            element = dict(element)
+            name = element.get('name')
+            if name is None or name in resolved:
+                raise ValueError(f"Layout elements need a unique 'name', got {name!r}")
+            if element.get('type') not in _ELEMENT_TYPES:
+                raise ValueError(f"Element '{name}' has unknown type {element.get('type')!r}. Valid options: {list(_ELEMENT_TYPES)}")
+            shadow = element.get('shadow')
+            if isinstance(shadow, str):
+                if shadow not in presets:
+                    raise ValueError(f"Element '{name}' uses unknown shadow preset '{shadow}'")
+                element['shadow'] = presets[shadow]
+            trigger = element.get('trigger')
+            if trigger is not None and trigger not in triggers:
+                raise ValueError(f"Element '{name}' has unknown trigger '{trigger}'. Valid options: {list(triggers)}")
+            resolved[name] = element
+        return resolved
+
+    def apply(self, data):
+        """
+        Apply a layout definition, rebuilding only what changed.
+
+        Args:
+            data (dict): Raw layout definition.
+
+        Returns:
+            list[str]: Names of the elements that were (re)built.
+        """
+        resolved = self.resolve(data, self.events)
+        rebuilt = []
+        elements = {}
+        try:
+            for name, definition in resolved.items():
+                current = self.elements.get(name)
+                if current is not None and current.definition == definition:
+                    elements[name] = current
+                    continue
+                element_type = _ELEMENT_TYPES[definition['type']]
+                previous = current if type(current) is element_type else None
+                elements[name] = element_type(self, definition, previous)
+                rebuilt.append(name)
+
+            for element in elements.values():
+                trigger = getattr(element, 'trigger', None)
+                if trigger is not None and trigger not in self.subscribed_events:
+                    self.events.on(trigger, lambda event, trigger=trigger: self._dispatch(trigger, event))
+                    self.subscribed_events.add(trigger)
+        except Exception:
+            # Discard the partially built layout without leaking its tweens or cache pins
+            for name in rebuilt:
+                elements[name].release(self)
+            raise
+
+        # Only release replaced elements once the whole layout built successfully
+        for name, element in self.elements.items():
+            if elements.get(name) is not element:
+                element.release(self)
+        self.elements = elements
+        screen = data.get('screen', {})
+        self.size = tuple(screen['size']) if 'size' in screen else self.size
+        self.background = tuple(screen['background']) if screen.get('background') else None
+
+        # Fresh elements pick up the latest values straight away
+        for name in rebuilt:
+            elements[name].update(self.snapshot, 0)
+        return rebuilt
+
+    def load(self, path):
+        """
+        Load and apply a layout file.
+
+        Args:
+            path (str, Path): Layout file.
+
+        Returns:
+            list[str]: Names of the elements that were (re)built.
+        """
+        return self.apply(load_layout_file(path))
+
+    def _dispatch(self, trigger, event):
+        for element in self.elements.values():
+            if getattr(element, 'trigger', None) == trigger:
+                element.on_event(event)
+
+    def update(self, snapshot, dt):
+        """
+        Feed the latest snapshot and advance animations.
+
+        Args:
+            snapshot (ScoreSnapshot): Latest snapshot, or None.
+            dt (float): Time elapsed since the last update (in seconds).
+        """
+        self.snapshot = snapshot
+        self.events.update(snapshot)
+        self.timeline.update(dt)
+        for element in self.elements.values():
+            element.update(snapshot, dt)
+
+    def draw(self, screen):
+        """
+        Draw every element in layout order, skipping elements entirely outside the screen's clip area.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+        """
+        if self.background is not None:
+            screen.fill(self.background)
+        self.viewport.draw(screen, self.elements.values())
+
+
+class LayoutWatcher:
+    def __init__(self, layout, path, interval=0.5):
+        """
+        Hot-reload a layout file when it changes on disk.
+
+        A background thread polls the file's modification time and parses changed files off the
+        render thread. The main loop calls `poll` once per frame to apply the latest parsed
+        definition, so only the (cached) element rebuild happens on the render thread. Files that
+        fail to parse or validate are reported and the current layout is kept.
+
+        Args:
+            layout (OverlayLayout): Layout to update.
+            path (str, Path): Layout file to watch.
+            interval (float): Seconds between modification time checks.
+        """
+        self.layout = layout
+        self.path = Path(path)
+        self.interval = interval
+        self.pending = queue.Queue()
+        self.mtime = None
+        self.running = False
+        self.thread = None
+
+    def _check(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError as e:
+            print(f"Cannot stat layout file: {e}")
+            return
+        if mtime == self.mtime:
+            return
+        self.mtime = mtime
+        try:
+            data = load_layout_file(self.path)
+            OverlayLayout.resolve(data, self.layout.events)  # Validate off the render thread
+        except Exception as e:
+            print(f"Error loading layout {self.path}: {e}")
+            return
+        self.pending.put(data)
+
+    def _watch(self):
+        while self.running:
+            self._check()
+            time.sleep(self.interval)
+
+    def start(self):
+        """
+        Load the layout synchronously, then start watching for changes.
+
+        Raises:
+            Exception: If the initial layout file cannot be read, parsed or applied. Unlike
+                later reloads, there is no current layout to fall back to.
+        """
+        self.mtime = os.stat(self.path).st_mtime_ns
+        self.layout.load(self.path)
+        self.running = True
+        self.thread = Thread(target=self._watch, daemon=True)
+        self.thread.start()
+
+    def poll(self):
+        """
+        Apply the most recent pending layout definition, if any. Call once per frame.
+
+        Returns:
+            list[str]: Names of the rebuilt elements, or None if nothing was pending.
+        """
+        data = None
+        while True:
+            try:
+                data = self.pending.get_nowait()
+            except queue.Empty:
+                break
+        if data is None:
+            return None
+        try:
+            rebuilt = self.layout.apply(data)
+        except Exception as e:
+            print(f"Error applying layout {self.path}: {e}")
+            return None
+        print(f"Reloaded layout {self.path}, rebuilt: {rebuilt}")
+        return rebuilt
+
+    def stop(self):
+        """Stop watching the layout file."""
+        self.running = False
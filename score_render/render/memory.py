@@ -0,0 +1,166 @@
+import time
+from collections import defaultdict, deque
+
+from score_render.elements import TextBox, TextLayoutCache, ParticleTrail, AnimationPNG
+from score_render.elements.sdf import SdfTextRenderer
+from score_render.elements.text_cache import LRUCache
+from .layout import OverlayLayout
+
+
+class MemoryRegistry:
+    def __init__(self, budget=None):
+        """
+        Account for the memory held by elements and caches, and keep it under a budget.
+
+        Registered objects are resolved to memory providers: objects with `memory_usage()` returning
+        (key, bytes, last_used) tuples and `evict(key)` returning the bytes released. Entries with a
+        last_used of None are pinned. Providers shared by several registered objects (e.g. baked
+        frames shared between animations) are only counted once.
+
+        When the total exceeds the budget, `enforce` evicts evictable entries across all providers,
+        least recently drawn first, until the total fits again.
+
+        Args:
+            budget (int): Memory budget in bytes. None disables eviction.
+        """
+        self.budget = budget
+        self.registered = {}
+        self.evictions = defaultdict(int)
+        self.evicted_bytes = defaultdict(int)
+        self.events = deque(maxlen=64)
+
+    def register(self, name, obj):
+        """
+        Register an element, cache or whole layout. Providers are resolved on every walk, so
+        registered layouts are accounted for correctly across reloads.
+
+        Args:
+            name (str): Name used in reports. Nested providers are reported as '<name>.<part>'.
+            obj (AnimationPNG, TextBox, ParticleTrail, TextLayoutCache, SdfTextRenderer, LRUCache,
+                OverlayLayout): Object to account for.
+        """
+        if not isinstance(obj, (AnimationPNG, TextBox, ParticleTrail, TextLayoutCache, SdfTextRenderer, LRUCache, OverlayLayout)):
+            raise TypeError(f"Cannot account for object of type {type(obj).__name__}")
+        self.registered[name] = obj
+
+    def unregister(self, name):
+        """
+        Stop accounting for a registered object.
+
+        Args:
+            name (str): Name it was registered under.
+        """
+        self.registered.pop(name, None)
+
+    @staticmethod
+    def _resolve(name, obj):
+        if isinstance(obj, AnimationPNG):
+            yield name, 'animation', obj.baked_frames
+        elif isinstance(obj, TextBox):
+            yield name, 'text', obj
+            if obj.shadow_mode == 'sdf':
+                yield from MemoryRegistry._resolve(f'{name}.sdf', obj.sdf_renderer)
+        elif isinstance(obj, ParticleTrail):
+            yield name, 'particles', obj
+        elif isinstance(obj, TextLayoutCache):
+            for part in ('strings', 'surfaces'):
+                yield f'{name}.{part}', 'text_cache', getattr(obj, part)
+        elif isinstance(obj, SdfTextRenderer):
+            yield name, 'text_cache', obj.cache
+            yield f'{name}.glyphs', 'text_cache', obj.glyphs
+        elif isinstance(obj, LRUCache):
+            yield name, 'text_cache', obj
+        elif isinstance(obj, OverlayLayout):
+            yield from MemoryRegistry._resolve(f'{name}.text_cache', obj.text_cache)
+            yield from MemoryRegistry._resolve(f'{name}.sdf', obj.sdf_renderer)
+            for key, frames in obj.baked_frames.items():
+                yield f'{name}.frames[{key[0]}]', 'animation', frames
+            for element_name, element in obj.elements.items():
+                if hasattr(element, 'text_box'):
+                    yield from MemoryRegistry._resolve(f'{name}.{element_name}', element.text_box)
+                elif hasattr(element, 'animation'):
+                    yield from MemoryRegistry._resolve(f'{name}.{element_name}', element.animation)
+
+    def providers(self):
+        """
+        Resolve registered objects to their memory providers.
+
+        Returns:
+            list[tuple]: (name, category, provider), each provider listed once.
+        """
+        seen = {}
+        for name, obj in self.registered.items():
+            for provider_name, category, provider in self._resolve(name, obj):
+                seen.setdefault(id(provider), (provider_name, category, provider))
+        return list(seen.values())
+
+    def report(self):
+        """
+        Walk every provider and total its memory.
+
+        Returns:
+            dict: 'total' bytes, 'budget', bytes per 'categories', and per-provider 'assets'
+            ({name, category, bytes, entries, evictable_bytes}), largest first.
+        """
+        categories = defaultdict(int)
+        assets = []
+        for name, category, provider in self.providers():
+            usage = provider.memory_usage()
+            size = sum(nbytes for _, nbytes, _ in usage)
+            evictable = sum(nbytes for _, nbytes, last_used in usage if last_used is not None)
+            categories[category] += size
+            assets.append(dict(name=name, category=category, bytes=size, entries=len(usage), evictable_bytes=evictable))
+        assets.sort(key=lambda asset: asset['bytes'], reverse=True)
+        return dict(total=sum(categories.values()), budget=self.budget, categories=dict(categories), assets=assets)
+
+    def enforce(self):
+        """
+        Evict least recently used entries until the total is within budget.
+
+        Returns:
+            int: Bytes released.
+        """
+        if self.budget is None:
+            return 0
+
+        total = 0
+        candidates = []
+        for name, category, provider in self.providers():
+            for key, nbytes, last_used in provider.memory_usage():
+                total += nbytes
+                if last_used is not None:
+                    candidates.append((last_used, nbytes, key, name, category, provider))
+        if total <= self.budget:
+            return 0
+
+        candidates.sort(key=lambda candidate: candidate[0])
+        freed = 0
+        for last_used, nbytes, key, name, category, provider in candidates:
+            if total - freed <= self.budget:
+                break
+            released = provider.evict(key)
+            freed += released
+            self.evictions[category] += 1
+            self.evicted_bytes[category] += released
+
+        self.events.append(dict(time=time.monotonic(), total=total, freed=freed, budget=self.budget))
+        if total - freed > self.budget:
+            print(f"Memory budget exceeded: {total - freed} bytes in use after eviction, budget {self.budget} bytes")
+        return freed
+
+    def metrics(self):
+        """
+        Get memory totals and eviction counts for reporting.
+
+        Returns:
+            dict: Total and per-category bytes, budget, and per-category eviction counts and bytes.
+        """
+        report = self.report()
+        return dict(
+            total=report['total'],
+            budget=self.budget,
+            categories=report['categories'],
+            evictions=dict(self.evictions),
+            evicted_bytes=dict(self.evicted_bytes),
+            recent_enforcements=list(self.events),
+        )
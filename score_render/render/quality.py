@@ -0,0 +1,188 @@
+import time
+from collections import deque
+
+from score_render.elements import TextBox, AnimationPNG, ParticleTrail
+
+
+class QualityTier:
+    def __init__(self, name, shadow_layers=None, interpolation_frames=None, max_particles=None, resolution_scale=1.0):
+        """
+        Effect limits applied to registered elements while the tier is active.
+
+        Args:
+            name (str): Tier name reported in metrics.
+            shadow_layers (int): Maximum number of `TextShadow` layers drawn per `TextBox`, keeping the
+                layers closest to the text. None draws every layer.
+            interpolation_frames (int): Maximum in-between frames per original `AnimationPNG` frame.
+                None uses every baked frame.
+            max_particles (int): Upper bound on `ParticleTrail.max_particles`. None keeps each trail's own cap.
+            resolution_scale (float): Internal render resolution relative to the output, see
+                `QualityGovernor.internal_size`.
+        """
+        self.name = name
+        self.shadow_layers = shadow_layers
+        self.interpolation_frames = interpolation_frames
+        self.max_particles = max_particles
+        self.resolution_scale = resolution_scale
+
+    def __repr__(self):
+        return f"QualityTier({self.name!r})"
+
+
+DEFAULT_TIERS = [
+    QualityTier('high'),
+    QualityTier('medium', shadow_layers=2, interpolation_frames=3, max_particles=300),
+    QualityTier('low', shadow_layers=1, interpolation_frames=1, max_particles=100, resolution_scale=0.75),
+    QualityTier('minimal', shadow_layers=0, interpolation_frames=0, max_particles=30, resolution_scale=0.5),
+]
+
+
+class QualityGovernor:
+    def __init__(self, target_fps=30, tiers=None, window=60, downgrade_ratio=0.95, upgrade_ratio=0.6, cooldown=3.0):
+        """
+        Step effect quality down under frame-time pressure and back up once headroom returns.
+
+        Feed it the time spent producing each frame (excluding the frame limiter's sleep, e.g.
+        `pygame.time.Clock.get_rawtime()`). Once a full window of samples is available, the 90th
+        percentile is compared to the frame budget: above `downgrade_ratio` of the budget drops one
+        tier, below `upgrade_ratio` restores one. Every change clears the window and starts a
+        cooldown, so the governor doesn't oscillate between neighbouring tiers.
+
+        Args:
+            target_fps (int): Frame rate the main loop is trying to hold.
+            tiers (list[QualityTier]): Tiers from best to cheapest. Defaults to `DEFAULT_TIERS`.
+            window (int): Number of frame samples evaluated per decision.
+            downgrade_ratio (float): Fraction of the frame budget above which quality is reduced.
+            upgrade_ratio (float): Fraction of the frame budget below which quality is restored.
+            cooldown (float): Minimum seconds between two tier changes.
+        """
+        self.tiers = list(tiers) if tiers is not None else list(DEFAULT_TIERS)
+        self.budget = 1.0 / target_fps
+        self.window = window
+        self.downgrade_ratio = downgrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.cooldown = cooldown
+
+        self.tier_index = 0
+        self.samples = deque(maxlen=window)
+        self.last_change = float('-inf')
+        self.decisions = deque(maxlen=32)
+        self.downgrades = 0
+        self.upgrades = 0
+        self.frames = 0
+
+        self.text_boxes = []
+        self.animations = []
+        self.particle_trails = {}  # ParticleTrail -> its own max_particles
+
+    @property
+    def tier(self):
+        """QualityTier: The currently active tier."""
+        return self.tiers[self.tier_index]
+
+    def register(self, *elements):
+        """
+        Put elements under the governor's control and apply the current tier to them.
+
+        Args:
+            *elements (TextBox, AnimationPNG, ParticleTrail): Elements to govern.
+        """
+        for element in elements:
+            if isinstance(element, TextBox):
+                self.text_boxes.append(element)
+            elif isinstance(element, AnimationPNG):
+                self.animations.append(element)
+            elif isinstance(element, ParticleTrail):
+                self.particle_trails[element] = element.max_particles
+            else:
+                raise TypeError(f"Cannot govern element of type {type(element).__name__}")
+        self.apply()
+
+    def apply(self):
+        """Apply the current tier's limits to every registered element."""
+        tier = self.tier
+        for text_box in self.text_boxes:
+            text_box.max_shadow_layers = tier.shadow_layers
+        for animation in self.animations:
+            animation.set_interpolation_frames(tier.interpolation_frames)
+        for trail, own_max in self.particle_trails.items():
+            trail.set_max_particles(own_max if tier.max_particles is None else min(own_max, tier.max_particles))
+
+    def internal_size(self, size):
+        """
+        Size of the internal render target for the current tier.
+
+        Main loops with resolution-independent layouts render at this size and scale the result up
+        to the output surface.
+
+        Args:
+            size (tuple): (width, height) of the output.
+
+        Returns:
+            tuple: (width, height) scaled by the tier's resolution scale.
+        """
+        scale = self.tier.resolution_scale
+        return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+    def _percentile(self, q):
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def _change_tier(self, index, reason, now):
+        previous = self.tier
+        self.tier_index = index
+        self.samples.clear()
+        self.last_change = now
+        self.decisions.append(dict(time=now, previous=previous.name, tier=self.tier.name, reason=reason))
+        print(f"Quality governor: {previous.name} -> {self.tier.name} ({reason})")
+        self.apply()
+
+    def record(self, frame_time):
+        """
+        Record the work time of one frame and change tier if warranted.
+
+        Args:
+            frame_time (float): Seconds spent producing the frame.
+
+        Returns:
+            bool: True if the tier changed.
+        """
+        self.frames += 1
+        self.samples.append(frame_time)
+        if len(self.samples) < self.window:
+            return False
+
+        now = time.monotonic()
+        if now - self.last_change < self.cooldown:
+            return False
+
+        p90 = self._percentile(0.9)
+        if p90 > self.budget * self.downgrade_ratio and self.tier_index < len(self.tiers) - 1:
+            self.downgrades += 1
+            self._change_tier(self.tier_index + 1, f"p90 frame time {1000 * p90:.1f} ms over budget", now)
+            return True
+        if p90 < self.budget * self.upgrade_ratio and self.tier_index > 0:
+            self.upgrades += 1
+            self._change_tier(self.tier_index - 1, f"p90 frame time {1000 * p90:.1f} ms has headroom", now)
+            return True
+        return False
+
+    def metrics(self):
+        """
+        Get the governor state for reporting.
+
+        Returns:
+            dict: Current tier, frame time statistics (seconds), change counts and recent decisions.
+        """
+        samples = list(self.samples)
+        return dict(
+            tier=self.tier.name,
+            tier_index=self.tier_index,
+            frame_budget=self.budget,
+            frame_time_mean=sum(samples) / len(samples) if samples else None,
+            frame_time_p90=self._percentile(0.9) if samples else None,
+            frames=self.frames,
+            downgrades=self.downgrades,
+            upgrades=self.upgrades,
+            decisions=list(self.decisions),
+        )
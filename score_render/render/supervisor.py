@@ -0,0 +1,224 @@
+import time
+import multiprocessing
+from threading import Thread, Lock
+
+from score_render.ingest import WebSocketHandler
+from score_render.ingest.snapshot import ScoreSnapshot
+from .frame_buffer import SharedFrameBuffer
+from .worker import run_worker
+
+
+class _WorkerHandle:
+    def __init__(self, spec, frame_buffer):
+        self.spec = spec
+        self.frame_buffer = frame_buffer
+        self.process = None
+        self.conn = None
+        self.restarts = 0
+        self.failures = 0  # Crashes since the worker last ran for a healthy period
+        self.started_at = 0.0
+        self.next_start = 0.0
+        self.last_sent = None  # Last snapshot delivered to the running process
+        self.crashed_on = None  # Snapshot in flight when the process last exited, never replayed to it
+
+
+class RenderSupervisor:
+    def __init__(self, uri, panels, use_ex_score=False, restart_delay=1.0, max_restart_delay=30.0, healthy_period=None):
+        """
+        Run the ingest layer once and fan score snapshots out to one render worker per panel.
+
+        Each panel is rendered by its own process, so panel count scales with core count instead of
+        serializing all drawing on a single pygame loop. Workers publish frames into shared memory
+        (see `frame_buffer`) and are restarted with exponential backoff if they crash. A restarted
+        worker is not sent the snapshot it was handling when it exited, in case that snapshot is what
+        crashed it; it picks up the next broadcast instead.
+
+        Args:
+            uri (str): WebSocket server URI of the ddrcv feed. If None, no ingest thread is started and
+                snapshots must be pushed with `broadcast`.
+            panels (list[PanelSpec]): Panels to render.
+            use_ex_score (bool): Forwarded to `ScoreSnapshot.from_message`.
+            restart_delay (float): Initial delay before restarting a crashed worker, in seconds.
+            max_restart_delay (float): Upper bound on the restart backoff, in seconds.
+            healthy_period (float): A worker that crashes after running at least this long is restarted
+                after `restart_delay` again, i.e. the backoff only counts recent failures. Defaults to
+                `max_restart_delay`.
+        """
+        names = [panel.name for panel in panels]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Panel names must be unique, got {names}")
+
+        self.uri = uri
+        self.use_ex_score = use_ex_score
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.healthy_period = healthy_period if healthy_period is not None else max_restart_delay
+        self.context = multiprocessing.get_context('spawn')
+        self.workers = {panel.name: _WorkerHandle(panel, SharedFrameBuffer(panel.size)) for panel in panels}
+        self.latest = None
+        self.lock = Lock()
+        self.running = False
+        self.websocket_handler = None
+        self.websocket_thread = None
+
+    def on_message(self, message):
+        """
+        WebSocket callback: parse the message and broadcast the resulting snapshot.
+
+        Args:
+            message (str): The message received from the WebSocket server.
+        """
+        try:
+            snapshot = ScoreSnapshot.from_message(message, use_ex_score=self.use_ex_score)
+        except Exception as e:
+            print(f"Error parsing message: {e}")
+            return
+        self.broadcast(snapshot)
+
+    def broadcast(self, snapshot):
+        """
+        Send a snapshot to every live worker. It is also replayed to workers started later, except to a
+        restarted worker that exited while handling it.
+
+        Args:
+            snapshot (ScoreSnapshot): The snapshot to send.
+        """
+        with self.lock:
+            self.latest = snapshot
+            for handle in self.workers.values():
+                self._send(handle, snapshot)
+
+    def _send(self, handle, message):
+        if handle.conn is None:
+            return
+        try:
+            handle.conn.send(message)
+        except (BrokenPipeError, EOFError, OSError):
+            # Worker died; `poll` will notice and restart it
+            return
+        if message is not None:
+            handle.last_sent = message
+
+    def _start_worker(self, handle):
+        reader, writer = self.context.Pipe(duplex=False)
+        process = self.context.Process(
+            target=run_worker,
+            args=(handle.spec, reader, handle.frame_buffer.name),
+            name=f"render-{handle.spec.name}",
+            daemon=True,
+        )
+        process.start()
+        reader.close()  # Only the worker reads
+        handle.process = process
+        handle.conn = writer
+        handle.started_at = time.monotonic()
+        handle.last_sent = None
+        if self.latest is not None and self.latest is not handle.crashed_on:
+            self._send(handle, self.latest)
+
+    def _reap(self, handle):
+        if handle.conn is not None:
+            handle.conn.close()
+            handle.conn = None
+        if handle.process is not None:
+            handle.process.join(timeout=0)
+            handle.process = None
+
+    def start(self):
+        """Start all render workers and the WebSocket ingest thread."""
+        self.running = True
+        with self.lock:
+            for handle in self.workers.values():
+                self._start_worker(handle)
+
+        if self.uri is not None:
+            self.websocket_handler = WebSocketHandler(self.uri, self.on_message)
+            self.websocket_thread = Thread(target=self.websocket_handler.start, daemon=True)
+            self.websocket_thread.start()
+
+    def poll(self):
+        """
+        Restart any worker that has exited. Call periodically from the supervisor main loop.
+
+        Returns:
+            list[str]: Names of the workers restarted by this call.
+        """
+        restarted = []
+        now = time.monotonic()
+        with self.lock:
+            for name, handle in self.workers.items():
+                if handle.process is not None and handle.process.is_alive():
+                    continue
+
+                if handle.process is not None:
+                    exitcode = handle.process.exitcode
+                    handle.crashed_on = handle.last_sent
+                    self._reap(handle)
+                    if now - handle.started_at >= self.healthy_period:
+                        handle.failures = 0
+                    delay = min(self.restart_delay * 2 ** handle.failures, self.max_restart_delay)
+                    handle.failures += 1
+                    handle.next_start = now + delay
+                    print(f"Render worker '{name}' exited with code {exitcode}. Restarting in {delay:.1f} seconds...")
+
+                if self.running and now >= handle.next_start:
+                    handle.restarts += 1
+                    self._start_worker(handle)
+                    restarted.append(name)
+        return restarted
+
+    def run(self, interval=0.5):
+        """
+        Block, supervising workers until `stop` is called or the process is interrupted.
+
+        Args:
+            interval (float): Seconds between worker health checks.
+        """
+        if not self.running:
+            self.start()
+        try:
+            while self.running:
+                self.poll()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def frame_buffer(self, name):
+        """
+        Get the shared frame buffer a panel publishes into.
+
+        Args:
+            name (str): Panel name.
+
+        Returns:
+            SharedFrameBuffer: The panel's frame buffer.
+        """
+        return self.workers[name].frame_buffer
+
+    def stop(self, timeout=2.0):
+        """
+        Stop the ingest thread and all workers, and release the shared frame buffers.
+
+        Args:
+            timeout (float): Seconds to wait for each worker to exit before terminating it.
+        """
+        if not self.running and all(handle.process is None for handle in self.workers.values()):
+            return
+        self.running = False
+
+        if self.websocket_handler is not None:
+            self.websocket_handler.stop()
+
+        with self.lock:
+            for handle in self.workers.values():
+                self._send(handle, None)
+            for handle in self.workers.values():
+                if handle.process is not None:
+                    handle.process.join(timeout)
+                    if handle.process.is_alive():
+                        handle.process.terminate()
+                        handle.process.join()
+                self._reap(handle)
+                handle.frame_buffer.close()
@@ -0,0 +1,67 @@
+import pygame
+
+
+class Viewport:
+    def __init__(self, rect=None, margin=0):
+        """
+        Frame-loop culling: only draw elements whose bounding box overlaps the visible area.
+
+        Elements expose `get_bounds()` returning a pygame.Rect in screen coordinates (or None when
+        their extent is unknown, in which case they are always drawn) and `draw(screen)`.
+
+        Args:
+            rect (pygame.Rect): Visible area in screen coordinates. If None, the clip area of the
+                surface being drawn on is used.
+            margin (int): Extra distance in pixels around the visible area within which elements are
+                still drawn.
+        """
+        self.rect = pygame.Rect(rect) if rect is not None else None
+        self.margin = margin
+        self.area = self.rect
+        self.drawn = 0
+        self.culled = 0
+
+    def begin(self, screen):
+        """
+        Start a frame: reset the counters and resolve the visible area.
+
+        Args:
+            screen (pygame.Surface): Surface the frame is drawn on.
+        """
+        area = self.rect if self.rect is not None else screen.get_clip()
+        self.area = area.inflate(2 * self.margin, 2 * self.margin)
+        self.drawn = 0
+        self.culled = 0
+
+    def visible(self, bounds):
+        """
+        Check whether a bounding box overlaps the visible area, counting it as drawn or culled.
+
+        Args:
+            bounds (pygame.Rect): Bounding box in screen coordinates, or None if unknown.
+
+        Returns:
+            bool: Whether the element should be drawn.
+        """
+        if bounds is None or bounds.colliderect(self.area):
+            self.drawn += 1
+            return True
+        self.culled += 1
+        return False
+
+    def draw(self, screen, elements):
+        """
+        Draw the elements that are visible, in order.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+            elements (iterable): Objects with `get_bounds()` and `draw(screen)`.
+
+        Returns:
+            int: Number of elements culled.
+        """
+        self.begin(screen)
+        for element in elements:
+            if self.visible(element.get_bounds()):
+                element.draw(screen)
+        return self.culled
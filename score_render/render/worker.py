@@ -0,0 +1,80 @@
+import os
+
+
+class PanelSpec:
+    def __init__(self, name, layout_factory, size, fps=30):
+        """
+        Description of a single output panel rendered by its own worker process.
+
+        Args:
+            name (str): Unique panel name (e.g. 'p1', 'cabinet-2', 'leaderboard').
+            layout_factory (callable): Module-level (picklable) callable taking the panel size and
+                returning a `render(screen, snapshot, dt)` callable. It runs inside the worker, after
+                pygame has been initialized, so it may load fonts and images.
+            size (tuple): (width, height) of the panel in pixels.
+            fps (int): Target frame rate of the worker.
+        """
+        self.name = name
+        self.layout_factory = layout_factory
+        self.size = tuple(size)
+        self.fps = fps
+
+
+def run_worker(spec, conn, frame_buffer_name):
+    """
+    Entry point of a headless render worker process.
+
+    Receives `ScoreSnapshot` updates from `conn` (only the latest pending one is kept each frame),
+    renders the panel layout and publishes every frame into the shared frame buffer. A `None`
+    message or a closed pipe stops the worker.
+
+    Args:
+        spec (PanelSpec): Panel to render.
+        conn (multiprocessing.connection.Connection): Receiving end of the supervisor pipe.
+        frame_buffer_name (str): Name of the `SharedFrameBuffer` to publish frames into.
+    """
+    # Render off-screen; the worker never opens a window of its own
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    import pygame
+    from .frame_buffer import SharedFrameBuffer
+
+    pygame.init()
+    # A display mode must exist for Surface.convert_alpha() to work, even headless
+    pygame.display.set_mode((1, 1))
+    screen = pygame.Surface(spec.size)
+    frame_buffer = SharedFrameBuffer(spec.size, name=frame_buffer_name, create=False)
+
+    try:
+        render = spec.layout_factory(spec.size)
+        clock = pygame.time.Clock()
+        snapshot = None
+        running = True
+
+        while running:
+            dt = clock.tick(spec.fps) / 1000
+
+            try:
+                while conn.poll():
+                    message = conn.recv()
+                    if message is None:
+                        running = False
+                        break
+                    snapshot = message
+            except EOFError:
+                # Supervisor went away
+                break
+
+            if not running:
+                break
+
+            render(screen, snapshot, dt)
+            frame_buffer.write(screen)
+    except Exception:
+        # multiprocessing prints the traceback once the exception leaves the process
+        print(f"Render worker '{spec.name}' crashed:")
+        raise
+    finally:
+        frame_buffer.close()
+        pygame.quit()